@@ -0,0 +1,85 @@
+"""
+Run all benchmarks, save results as JSON and compare them with results of another commit.
+
+    python -m benchmarks --output results.json
+    python -m benchmarks --compare baseline.json --threshold 0.1
+
+Exit code is 1 if some benchmark is slower than in baseline by more than threshold.
+"""
+import argparse
+import importlib
+import json
+import platform
+import sys
+from typing import Dict, List, Tuple
+
+from benchmarks.utils import setup_django
+
+setup_django()
+
+import django  # noqa: E402
+import pydantic  # noqa: E402
+
+MODULES = (
+    "bench_arguments",
+    "bench_camelcase",
+    "bench_formats",
+    "bench_json",
+    "bench_pipeline",
+    "bench_resolve",
+    "bench_startup",
+)
+
+
+def run(modules=MODULES) -> Dict[str, float]:
+    results = {}
+    for name in modules:
+        print("Running %s..." % name, file=sys.stderr)
+        results.update(importlib.import_module("benchmarks.%s" % name).run())
+    return results
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float], threshold: float) -> List[Tuple[str, float]]:
+    """ Return benchmarks slower than in baseline by more than threshold with relative change """
+    regressions = []
+    for name, value in sorted(results.items()):
+        if name not in baseline:
+            continue
+        change = value / baseline[name] - 1
+        if change < -threshold:
+            regressions.append((name, change))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", help="save results to JSON file")
+    parser.add_argument("--compare", help="JSON file with baseline results")
+    parser.add_argument("--threshold", type=float, default=0.1, help="allowed slowdown, 0.1 is 10%%")
+    parser.add_argument("--only", nargs="+", choices=MODULES, default=MODULES, help="benchmark modules to run")
+    args = parser.parse_args(argv)
+
+    results = run(args.only)
+    for name, value in sorted(results.items()):
+        print("%-50s %15.1f ops/sec" % (name, value))
+
+    if args.output:
+        meta = {"python": platform.python_version(), "django": django.__version__, "pydantic": pydantic.VERSION}
+        with open(args.output, "w") as f:
+            json.dump({"meta": meta, "results": results}, f, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+
+        regressions = compare(results, baseline, args.threshold)
+        for name, change in regressions:
+            print("REGRESSION %-50s %+.1f%%" % (name, change * 100))
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+"""
+Arguments loading: per-argument `parse_obj_as` calls vs one pass through the compiled view arguments model.
+
+    python -m benchmarks.bench_arguments
+"""
+from typing import Dict
+
+from benchmarks.utils import setup_django, make_view, measure, report
+
+setup_django()
+
+from django.test import RequestFactory  # noqa: E402
+from pydantic import parse_obj_as  # noqa: E402
+
+from djhug import route  # noqa: E402
+from djhug.constants import EMPTY  # noqa: E402
+
+ARGS_COUNTS = (1, 5, 20)
+
+
+def load_value(value, kind):
+    """ Previous per-argument loading, kept here for comparison only """
+    if kind is None or kind is EMPTY:
+        return value
+
+    return parse_obj_as(kind, value)
+
+
+def run() -> Dict[str, float]:
+    factory = RequestFactory()
+    results = {}
+
+    for count in ARGS_COUNTS:
+        view = route(make_view(count))
+        spec = view.__djhug_options__.spec
+        values = {arg.name: str(i) for i, arg in enumerate(spec.args[1:])}
+        request = factory.get("/", values)
+
+        def per_argument():
+            return {arg.name: load_value(values[arg.name], arg.type) for arg in spec.args[1:]}
+
+        def compiled():
+            return spec.loader.load(values)
+
+        def full_request():
+            return view(request)
+
+        results["arguments.per_argument.%d" % count] = measure(per_argument)
+        results["arguments.compiled.%d" % count] = measure(compiled)
+        results["arguments.full_request.%d" % count] = measure(full_request)
+
+    return results
+
+
+def main():
+    results = run()
+    rows = [
+        (count, *(results["arguments.%s.%d" % (name, count)] for name in ("per_argument", "compiled", "full_request")))
+        for count in ARGS_COUNTS
+    ]
+    report("Arguments loading, operations/sec", ("typed args", "per argument", "compiled", "full request"), rows)
+
+
+if __name__ == "__main__":
+    main()
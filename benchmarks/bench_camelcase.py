@@ -0,0 +1,71 @@
+"""
+Keys camelcasing of a 10k elements list of nested dicts: recursive uncached transform vs iterative cached one.
+
+    python -m benchmarks.bench_camelcase
+"""
+from typing import List, Dict
+
+from pydantic import BaseModel
+
+from djhug.utils import camelcase, camelcase_text, get_model_key_map
+from benchmarks.utils import measure, report
+
+SIZE = 10000
+
+
+class Stock(BaseModel):
+    warehouse_name: str
+    quantity_available: int
+
+
+class Product(BaseModel):
+    product_id: int
+    product_name: str
+    unit_price: float
+    stock_items: List[Stock]
+
+
+def legacy_camelcase(content):
+    """ Transform used before keys caching: recursive, converts every key with regex and `str.title` """
+    if isinstance(content, dict):
+        return {
+            (camelcase_text.__wrapped__(key) if isinstance(key, str) else key): legacy_camelcase(value)
+            for key, value in content.items()
+        }
+    elif isinstance(content, list):
+        return [legacy_camelcase(element) for element in content]
+    return content
+
+
+def make_payload(size: int) -> list:
+    return [
+        {
+            "product_id": i,
+            "product_name": "Product %d" % i,
+            "unit_price": i * 1.5,
+            "stock_items": [{"warehouse_name": "main", "quantity_available": i}, {"warehouse_name": "extra"}],
+        }
+        for i in range(size)
+    ]
+
+
+def run() -> Dict[str, float]:
+    payload = make_payload(SIZE)
+    key_map = get_model_key_map(Product, camelcase_text)
+
+    assert legacy_camelcase(payload) == camelcase(payload) == camelcase(payload, key_map=key_map)
+
+    return {
+        "camelcase.recursive": measure(lambda: legacy_camelcase(payload), number=5),
+        "camelcase.iterative": measure(lambda: camelcase(payload), number=5),
+        "camelcase.key_map": measure(lambda: camelcase(payload, key_map=key_map), number=5),
+    }
+
+
+def main():
+    rows = [(name.split(".")[1], value) for name, value in run().items()]
+    report("Camelcase %d nested dicts, operations/sec" % SIZE, ("transform", "ops/sec"), rows)
+
+
+if __name__ == "__main__":
+    main()
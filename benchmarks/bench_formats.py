@@ -0,0 +1,73 @@
+"""
+Binary formats compared with JSON: payload size, rendering and parsing of typical list endpoint payloads.
+
+    python -m benchmarks.bench_formats
+"""
+from typing import Dict
+
+from benchmarks.bench_json import make_payload
+from benchmarks.utils import setup_django, measure, report
+
+setup_django()
+
+from django.test import RequestFactory  # noqa: E402
+
+from djhug.constants import ContentType  # noqa: E402
+from djhug.content_negotiation import get_request_parsers, get_response_renderers  # noqa: E402
+
+FORMATS = {"json": ContentType.JSON, "msgpack": ContentType.MSGPACK, "cbor": ContentType.CBOR}
+SIZES = (10, 1000)
+
+
+def get_available_formats() -> Dict[str, str]:
+    available = {}
+    for name, content_type in FORMATS.items():
+        if content_type in get_response_renderers():
+            available[name] = content_type
+        else:
+            print("Format %s is not available, skipped" % name)
+    return available
+
+
+def render(content_type: str, payload) -> bytes:
+    rendered = get_response_renderers()[content_type](payload)
+    return rendered if isinstance(rendered, bytes) else rendered.encode()
+
+
+def run() -> Dict[str, float]:
+    factory = RequestFactory()
+    results = {}
+
+    for name, content_type in get_available_formats().items():
+        renderer = get_response_renderers()[content_type]
+        parser = get_request_parsers()[content_type]
+
+        for size in SIZES:
+            payload = make_payload(size)
+            request = factory.post("/", render(content_type, payload), content_type=content_type)
+            number = max(10, 10000 // size)
+
+            results["formats.%s.render.%d" % (name, size)] = measure(lambda: renderer(payload), number=number)
+            results["formats.%s.parse.%d" % (name, size)] = measure(lambda: parser(request), number=number)
+
+    return results
+
+
+def main():
+    results = run()
+    rows = [
+        (
+            name,
+            size,
+            len(render(content_type, make_payload(size))),
+            results["formats.%s.render.%d" % (name, size)],
+            results["formats.%s.parse.%d" % (name, size)],
+        )
+        for name, content_type in get_available_formats().items()
+        for size in SIZES
+    ]
+    report("Response formats, operations/sec", ("format", "items", "bytes", "render", "parse"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+JSON backends: rendering and parsing of typical list endpoint payloads.
+
+    python -m benchmarks.bench_json
+"""
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Dict
+
+from benchmarks.utils import setup_django, measure, report
+
+setup_django()
+
+from djhug.json_backends import BACKENDS, load_json_backend  # noqa: E402
+from djhug.exceptions import ConfigError  # noqa: E402
+
+SIZES = (10, 1000)
+
+
+def make_payload(size: int) -> list:
+    now = datetime(2020, 1, 1, 12)
+    return [
+        {
+            "id": i,
+            "uuid": uuid.UUID(int=i),
+            "name": "Product %d" % i,
+            "price": Decimal("%d.99" % i),
+            "created_at": now + timedelta(minutes=i),
+            "tags": ["tag-1", "tag-2"],
+            "stock": {"warehouse": "main", "quantity": i * 3, "reserved": None},
+        }
+        for i in range(size)
+    ]
+
+
+def run() -> Dict[str, float]:
+    results = {}
+
+    for name in BACKENDS:
+        try:
+            backend = load_json_backend(name)
+        except ConfigError:
+            print("JSON backend %s is not available, skipped" % name)
+            continue
+
+        for size in SIZES:
+            payload = make_payload(size)
+            rendered = backend.dumps(payload)
+            raw = rendered if isinstance(rendered, bytes) else rendered.encode()
+            number = max(10, 10000 // size)
+
+            results["json.%s.render.%d" % (name, size)] = measure(lambda: backend.dumps(payload), number=number)
+            results["json.%s.parse.%d" % (name, size)] = measure(lambda: backend.loads(raw), number=number)
+
+    return results
+
+
+def main():
+    results = run()
+    rows = [
+        (name, size, results["json.%s.render.%d" % (name, size)], results["json.%s.parse.%d" % (name, size)])
+        for name in BACKENDS
+        for size in SIZES
+        if "json.%s.render.%d" % (name, size) in results
+    ]
+    report("JSON backends, operations/sec", ("backend", "items", "render", "parse"), rows)
+
+
+if __name__ == "__main__":
+    main()
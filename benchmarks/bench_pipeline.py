@@ -0,0 +1,161 @@
+"""
+Request pipeline stages measured separately for view shapes from `example/demo/views.py`.
+
+    python -m benchmarks.bench_pipeline
+"""
+from datetime import datetime
+from typing import Dict, List
+
+from benchmarks.utils import setup_django, measure, report
+
+setup_django()
+
+from django.test import RequestFactory  # noqa: E402
+from pydantic import BaseModel  # noqa: E402
+
+import djhug  # noqa: E402
+from djhug.content_negotiation import json_parser, json_renderer  # noqa: E402
+from djhug.models import get_model_serializer  # noqa: E402
+from djhug.requests_handler import RequestsHandler  # noqa: E402
+from djhug.utils import camelcase  # noqa: E402
+
+STAGES = (
+    "resolve_args",
+    "load_values",
+    "parse_body",
+    "body_model",
+    "response_model",
+    "response_trusted",
+    "camelcase",
+    "render",
+    "full_request",
+)
+
+
+class Product(BaseModel):
+    product_id: int
+    product_name: str
+    unit_price: float
+
+
+class Order(djhug.Body):
+    order_id: int
+    created_at: datetime
+    products: List[Product]
+
+
+class OrderResponse(BaseModel):
+    order_id: int
+    products_count: int
+    products: List[Product]
+
+
+def query_view(request, year: float, name: str, rr: int = 2):
+    return {"year": year, "name": name, "rr": rr}
+
+
+def path_view(request, year, name: int):
+    return {"year": year, "name": name}
+
+
+@djhug.response.camelcased
+def camelcased_view(request, year, name: int, date: datetime):
+    return {"some_data": 1, "year": year, "name": name, "date": date}
+
+
+def body_view(request, order: Order):
+    return {"order_id": order.order_id, "products_count": len(order.products), "products": order.products}
+
+
+@djhug.request.fused_validation
+def body_fused_view(request, order: Order):
+    return body_view(request, order)
+
+
+def list_view(request, count: int):
+    return [{"product_id": i, "product_name": "Product %d" % i, "unit_price": i * 1.5} for i in range(count)]
+
+
+def make_shapes(factory: RequestFactory) -> dict:
+    routes = djhug.Routes()
+    routes.get("query/")(query_view)
+    routes.get("<int:year>/")(path_view)
+    routes.get("camelcased/")(camelcased_view)
+    routes.post("body/", response_model=OrderResponse)(body_view)
+    routes.post("body-fused/", response_model=OrderResponse)(body_fused_view)
+    routes.get("list/", response_model=List[Product])(list_view)
+
+    products = [{"product_id": i, "product_name": "Product %d" % i, "unit_price": i * 1.5} for i in range(50)]
+    order = {"order_id": 1, "created_at": "2020-10-12T12:00:00", "products": products}
+
+    return {
+        "query": (query_view, factory.get("/query/", {"year": "2020.5", "name": "demo"}), {}),
+        "path": (path_view, factory.get("/2020/", {"name": "10"}), {"year": 2020}),
+        "camelcased": (
+            camelcased_view,
+            factory.get("/camelcased/", {"year": "2020", "name": "2", "date": "2020-10-12T12:00"}),
+            {},
+        ),
+        "body": (body_view, factory.post("/body/", order, content_type="application/json"), {}),
+        "body_fused": (body_fused_view, factory.post("/body-fused/", order, content_type="application/json"), {}),
+        "list": (list_view, factory.get("/list/", {"count": "50"}), {}),
+    }
+
+
+def run() -> Dict[str, float]:
+    results = {}
+
+    for shape, (view, request, path_kwargs) in make_shapes(RequestFactory()).items():
+        handler: RequestsHandler = RequestsHandler.create(view)
+        handler.compile()
+        opts = handler.opts
+
+        query = request.GET.dict()
+        body = json_parser(request) if request.method == "POST" else {}
+        values, _ = handler.resolver.resolve(path_kwargs, query, body)
+        if handler.loader.body_name:
+            values[handler.loader.body_name] = body
+        content = handler.view(request, **handler.process_request(request, dict(path_kwargs)))
+
+        serializer = None
+        if opts.response_model:
+            serializer = get_model_serializer(opts.response_model, opts.camelcased_response_data)
+        elif opts.camelcased_response_data:
+            serializer = camelcase
+        rendered_content = serializer(content) if serializer else content
+
+        stages = {
+            "resolve_args": lambda: handler.resolver.resolve(path_kwargs, request.GET.dict(), body),
+            "load_values": lambda: handler.loader.load(values),
+            "render": lambda: json_renderer(rendered_content),
+            "full_request": lambda: handler(request, **path_kwargs),
+        }
+        if handler.body_model and not handler.loader.body_name:
+            stages["body_model"] = lambda: handler.body_model.parse_obj(body)
+        if handler.body_model:
+            stages["parse_body"] = lambda: json_parser(request)
+        if opts.response_model:
+            stages["response_model"] = lambda: serializer(content)
+            trusted = get_model_serializer(opts.response_model, opts.camelcased_response_data, "trusted")
+            stages["response_trusted"] = lambda: trusted(content)
+        elif opts.camelcased_response_data:
+            stages["camelcase"] = lambda: camelcase(content)
+
+        for stage, fn in stages.items():
+            results["pipeline.%s.%s" % (shape, stage)] = measure(fn)
+
+    return results
+
+
+def main():
+    results = run()
+    shapes = sorted({name.split(".")[1] for name in results})
+    rows = [
+        (stage, *(results.get("pipeline.%s.%s" % (shape, stage), "-") for shape in shapes))
+        for stage in STAGES
+    ]
+    report("Request pipeline stages, operations/sec", ("stage", *shapes), rows)
+
+
+if __name__ == "__main__":
+    main()
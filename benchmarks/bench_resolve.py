@@ -0,0 +1,56 @@
+"""
+URL resolution: Django resolver trying url patterns one by one vs `Routes(tree=True)` prefix tree.
+
+    python -m benchmarks.bench_resolve
+"""
+from itertools import count
+from typing import Dict
+
+from benchmarks.utils import setup_django, make_view, measure, report
+
+setup_django()
+
+from django.urls import URLResolver  # noqa: E402
+from django.urls.resolvers import RegexPattern  # noqa: E402
+
+import djhug  # noqa: E402
+
+ROUTES_COUNTS = (10, 100, 1000)
+
+_views_counter = count()
+
+
+def make_resolver(routes_count: int, tree: bool) -> URLResolver:
+    """ Root resolver of routes with typical shapes: list, detail and nested detail of every resource """
+    routes = djhug.Routes(prefix="api", lazy=True, tree=tree)
+    for i in range(routes_count):
+        view = make_view(1)
+        view.__name__ = view.__qualname__ = "view_%d" % next(_views_counter)
+        shape = ("resource-%d/", "resource-%d/<int:arg_0>/", "resource-%d/<int:arg_0>/items/<slug:slug>/")[i % 3]
+        routes.get(shape % (i // 3))(view)
+    return URLResolver(RegexPattern(r"^/"), routes.get_urlpatterns())
+
+
+def run() -> Dict[str, float]:
+    results = {}
+    for routes_count in ROUTES_COUNTS:
+        # the last detail route, the worst case for one by one matching
+        path = "/api/resource-%d/10/" % ((routes_count - 2) // 3)
+        for mode in ("linear", "tree"):
+            resolver = make_resolver(routes_count, tree=mode == "tree")
+            resolver.resolve(path)
+            results["resolve.%s.%d" % (mode, routes_count)] = measure(lambda: resolver.resolve(path))
+    return results
+
+
+def main():
+    results = run()
+    rows = [
+        (routes_count, results["resolve.linear.%d" % routes_count], results["resolve.tree.%d" % routes_count])
+        for routes_count in ROUTES_COUNTS
+    ]
+    report("URL resolution, operations/sec", ("routes", "linear", "tree"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Startup time of URLconf with generated routes: eager handlers compilation vs lazy routes.
+
+    python -m benchmarks.bench_startup
+"""
+from itertools import count
+from typing import Dict
+
+from benchmarks.utils import setup_django, make_view, measure, report
+
+setup_django()
+
+import djhug  # noqa: E402
+
+ROUTES_COUNT = 1000
+ARGS_COUNT = 5
+
+_views_counter = count()
+
+
+def build_urlpatterns(lazy: bool) -> list:
+    routes = djhug.Routes(prefix="api", lazy=lazy)
+    for i in range(ROUTES_COUNT):
+        view = make_view(ARGS_COUNT)
+        view.__name__ = view.__qualname__ = "view_%d" % next(_views_counter)
+        routes.get("route-%d/<int:arg_0>/" % i)(view)
+    return routes.get_urlpatterns()
+
+
+def run() -> Dict[str, float]:
+    return {
+        "startup.eager.%d" % ROUTES_COUNT: measure(lambda: build_urlpatterns(lazy=False), number=1, repeat=3),
+        "startup.lazy.%d" % ROUTES_COUNT: measure(lambda: build_urlpatterns(lazy=True), number=1, repeat=3),
+    }
+
+
+def main():
+    results = run()
+    rows = [(name.split(".")[1], value, 1000 / value) for name, value in results.items()]
+    report("URLconf with %d routes" % ROUTES_COUNT, ("mode", "builds/sec", "ms per build"), rows)
+
+
+if __name__ == "__main__":
+    main()
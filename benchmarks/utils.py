@@ -0,0 +1,50 @@
+import inspect
+import timeit
+from typing import Callable, Iterable, Tuple, Any
+
+import django
+from django.conf import settings
+
+
+def setup_django(**overrides):
+    if not settings.configured:
+        settings.configure(
+            **{
+                "DEBUG": False,
+                "SECRET_KEY": "not very secret in benchmarks",
+                "ROOT_URLCONF": __name__,
+                "ALLOWED_HOSTS": ["*"],
+                **overrides,
+            }
+        )
+        django.setup()
+
+
+def make_view(args_count: int, kind: Any = int) -> Callable:
+    """ Create view with `args_count` typed query arguments: arg_0, arg_1... """
+
+    def view(request, **kwargs):
+        return kwargs
+
+    parameters = [inspect.Parameter("request", inspect.Parameter.POSITIONAL_OR_KEYWORD)]
+    parameters += [
+        inspect.Parameter("arg_%d" % i, inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=kind)
+        for i in range(args_count)
+    ]
+    view.__signature__ = inspect.Signature(parameters)
+    view.__name__ = view.__qualname__ = "view_%d" % args_count
+    return view
+
+
+def measure(fn: Callable, number: int = 1000, repeat: int = 5) -> float:
+    """ Return best of `repeat` runs in operations per second """
+    best = min(timeit.repeat(fn, number=number, repeat=repeat))
+    return number / best
+
+
+def report(title: str, header: Iterable[str], rows: Iterable[Tuple]):
+    print(title)
+    print("  " + "".join("%-20s" % column for column in header))
+    for row in rows:
+        print("  " + "".join(("%-20.1f" if isinstance(value, float) else "%-20s") % value for value in row))
+    print()
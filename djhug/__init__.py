@@ -1,4 +1,4 @@
-from .content_negotiation import request_parser, response_renderer
+from .content_negotiation import request_parser, response_renderer, response_stream_renderer
 from .shortcuts import request, response
 from .routes import Routes, route
 from .arguments import Body
@@ -1,13 +1,32 @@
 import inspect
-from typing import Callable, List, Optional, Dict, Any, Type, Mapping, Union
+from itertools import islice
+from typing import Callable, List, Optional, Dict, Any, Type, Mapping, Union, Tuple, Iterator
 
-from dataclasses import dataclass
-from pydantic import parse_obj_as, confloat, BaseModel, ValidationError as PydanticValidationError
+from dataclasses import dataclass, field
+from pydantic import (
+    confloat,
+    BaseConfig,
+    BaseModel,
+    Field,
+    ValidationError as PydanticValidationError,
+    create_model,
+    validate_model,
+    validator,
+)
+from pydantic.error_wrappers import ErrorWrapper, flatten_errors
+from pydantic.utils import ROOT_KEY
 
 from .constants import EMPTY
 from .exceptions import ValidationError
 from .utils import camelcase_text
 
+try:
+    from typing import get_origin
+except ImportError:  # pragma: no cover
+    from typing_extensions import get_origin
+
+SEQUENCE_TYPES = (list, set, frozenset, tuple)
+
 
 class Body(BaseModel):
     pass
@@ -20,6 +39,181 @@ class Arg:
     default: Any
 
 
+class ArgumentsLoader:
+    """
+    Validate all typed view arguments in one pass with a model compiled once per view.
+    Model is compiled on first use or by explicit `compile` call.
+    Body model is validated in the same pass if `body_name` and `body_model` are passed.
+    """
+
+    class Config(BaseConfig):
+        arbitrary_types_allowed = True
+
+    def __init__(
+        self, name: str, args: List[Arg], body_name: Optional[str] = None, body_model: Optional[Type[Body]] = None
+    ):
+        self.name = name
+        self.untyped = frozenset(arg.name for arg in args if arg.type is None or arg.type is EMPTY)
+        self.fields = {}
+        self.body_name = body_name if body_model else None
+
+        self._fields = {}
+        for i, arg in enumerate(args):
+            if arg.name in self.untyped:
+                continue
+            # arguments are stored under generated names so they can't clash with `BaseModel` attributes
+            field_name = "arg_%d" % i
+            self.fields[field_name] = arg.name
+            self._fields[field_name] = (arg.type, Field(EMPTY, alias=arg.name))
+
+        if self.body_name:
+            self.fields["body"] = body_name
+            self._fields["body"] = (body_model, Field(EMPTY, alias=body_name))
+
+        self._model: Optional[Type[BaseModel]] = None
+        self.compiled = False
+
+    @property
+    def model(self) -> Optional[Type[BaseModel]]:
+        if not self.compiled:
+            self.compile()
+        return self._model
+
+    def compile(self):
+        if self._fields:
+            validators = {"body_dict": validator("body", pre=True, allow_reuse=True)(_check_body_dict)}
+            self._model = create_model(
+                "%sArguments" % self.name,
+                __config__=self.Config,
+                __validators__=validators if self.body_name else None,
+                **self._fields,
+            )
+        self.compiled = True
+
+    def load(
+        self, values: Dict[str, Any], max_errors: Optional[int] = None
+    ) -> Tuple[Dict[str, Any], Dict[str, List[dict]]]:
+        """ Return loaded values and validation errors (up to `max_errors`) grouped by argument name """
+        model = self.model
+        if model is None:
+            return dict(values), {}
+
+        loaded, fields_set, error = validate_model(model, values)
+
+        result = {name: value for name, value in values.items() if name in self.untyped}
+        for field_name in fields_set:
+            if field_name in loaded:
+                result[self.fields[field_name]] = loaded[field_name]
+
+        errors = {}
+        if error is not None:
+            for err in iter_errors(error, max_errors):
+                name, *loc = err["loc"]
+                # keep errors in the same shape as for standalone `parse_obj_as` and body model `parse_obj` calls
+                loc = tuple(loc) if name == self.body_name else ("__root__", *loc)
+                errors.setdefault(name, []).append({**err, "loc": loc})
+
+        return result, errors
+
+
+def _check_body_dict(cls, value, field):
+    """ Body which isn't dict fails with the same error as body model `parse_obj` call """
+    if isinstance(value, dict):
+        return value
+
+    try:
+        return dict(value)
+    except (TypeError, ValueError) as e:
+        exc = TypeError("%s expected dict not %s" % (field.type_.__name__, value.__class__.__name__))
+        raise PydanticValidationError([ErrorWrapper(exc, loc=ROOT_KEY)], field.type_) from e
+
+
+@dataclass(frozen=True)
+class ArgLookup:
+    name: str
+    keys: Tuple[str, ...]
+    default: Any
+    many: bool = False
+
+    @property
+    def required(self) -> bool:
+        return self.default is EMPTY
+
+
+class ArgumentsResolver:
+    """
+    Find raw values of view arguments in path kwargs, query and request body (in that priority),
+    lookup keys of every argument are computed once per view.
+    Arguments annotated with `List`, `Set` or `Tuple` get all values of repeated query parameter,
+    values are also split by `list_separator` if it's set, e.g. `?id=1,2&id=3`.
+    """
+
+    def __init__(self, args: List[Arg], camelcased_data: bool = False, list_separator: Optional[str] = None):
+        self.list_separator = list_separator
+        self.lookups = tuple(
+            ArgLookup(
+                name=arg.name,
+                keys=_get_lookup_keys(arg.name, camelcased_data),
+                default=arg.default,
+                many=is_sequence_type(arg.type),
+            )
+            for arg in args
+        )
+
+    def resolve(
+        self, path_kwargs: Optional[Mapping], query: Optional[Mapping], request_body: Optional[Any]
+    ) -> Tuple[Dict[str, Any], List[str]]:
+        """ Return found values and names of missing required arguments, `query` is usually a `QueryDict` """
+        sources = [source for source in (path_kwargs, query, request_body) if source]
+
+        values = {}
+        missing = []
+        for lookup in self.lookups:
+            for source in sources:
+                for key in lookup.keys:
+                    if key in source:
+                        if lookup.many and source is query:
+                            values[lookup.name] = self._get_list(query, key)
+                        else:
+                            values[lookup.name] = source[key]
+                        break
+                else:
+                    continue
+                break
+            else:
+                if lookup.required:
+                    missing.append(lookup.name)
+
+        return values, missing
+
+    def _get_list(self, query: Mapping, key: str) -> List[str]:
+        items = query.getlist(key) if hasattr(query, "getlist") else [query[key]]
+        if self.list_separator is None:
+            return items
+
+        return [value for item in items for value in item.split(self.list_separator) if value]
+
+
+def is_sequence_type(annotation: Any) -> bool:
+    """ Check if annotation is list, set or tuple type, e.g. `List[int]` or `Optional[Tuple[int, ...]]` """
+    if annotation in SEQUENCE_TYPES:
+        return True
+
+    origin = get_origin(annotation)
+    if origin is Union:
+        return any(is_sequence_type(arg) for arg in annotation.__args__ if arg is not type(None))
+
+    return origin in SEQUENCE_TYPES
+
+
+def _get_lookup_keys(name: str, camelcased_data: bool) -> Tuple[str, ...]:
+    if not camelcased_data:
+        return (name,)
+
+    camelcased = camelcase_text(name)
+    return (camelcased,) if camelcased == name else (camelcased, name)
+
+
 @dataclass
 class Spec:
     args: List[Arg]
@@ -28,6 +222,8 @@ class Spec:
     body_name: Optional[str]
     body_model: Optional[Type[Body]]
 
+    loader: Optional[ArgumentsLoader] = field(default=None, repr=False, compare=False)
+
     @property
     def arg_types_map(self):
         return {arg.name: arg.type for arg in self.args}
@@ -47,57 +243,53 @@ class Spec:
                 continue
 
             annotation = None if param.annotation is EMPTY else param.annotation
-            if annotation and issubclass(annotation, Body):
+            if isinstance(annotation, type) and issubclass(annotation, Body):
                 body_model = annotation
                 body_name = name
             else:
                 args.append(Arg(name=name, type=arg_types_override.get(name, annotation), default=param.default))
 
-        return cls(args=args, body_name=body_name, body_model=body_model, return_type=signature.return_annotation,)
-
-
-def get_value(
-    name: str,
-    path_kwargs: Optional[dict] = None,
-    request_body: Optional[Any] = None,
-    query: Optional[Mapping] = None,
-    camelcased_data: bool = False,
-):
-    val = EMPTY
-
-    original_name = name
-    if camelcased_data:
-        name = camelcase_text(name)
-
-    if val is EMPTY and path_kwargs:
-        val = path_kwargs.get(name, EMPTY)
+        return cls(
+            args=args,
+            body_name=body_name,
+            body_model=body_model,
+            return_type=signature.return_annotation,
+            # first argument is always a request, it's never loaded
+            loader=ArgumentsLoader(fn.__name__, args[1:]),
+        )
 
-    if val is EMPTY:
-        val = query.get(name, EMPTY)
-    if val is EMPTY and camelcased_data:
-        val = query.get(original_name, EMPTY)
 
-    if val is EMPTY and request_body is not None:
-        val = request_body.get(name, EMPTY)
+def iter_errors(error: PydanticValidationError, max_errors: Optional[int] = None) -> Iterator[dict]:
+    """ Same as `error.errors()`, but error dicts are built lazily and only up to `max_errors` """
+    try:
+        config = error.model.__config__
+    except AttributeError:
+        config = error.model.__pydantic_model__.__config__
 
-    return val
+    return islice(flatten_errors(error.raw_errors, config), max_errors)
 
 
-def load_value(value, kind: Optional[Any]):
-    if kind is None or kind is EMPTY:
-        return value
-
-    return parse_obj_as(kind, value)
-
-
-def normalize_error_messages(errors: Dict[str, Exception]) -> Dict[str, List[Union[dict, str]]]:
+def normalize_error_messages(
+    errors: Dict[str, Exception], max_errors: Optional[int] = None
+) -> Dict[str, List[Union[dict, str]]]:
+    """ Convert errors to lists of messages, there are no more than `max_errors` messages in total """
     result = {}
+    remaining = max_errors
     for field_name, error in errors.items():
+        if remaining is not None and remaining <= 0:
+            break
+
         if isinstance(error, PydanticValidationError):
-            result[field_name] = error.errors()
+            messages = list(iter_errors(error, remaining))
+        elif isinstance(error, list):
+            messages = error[:remaining]
         elif isinstance(error, ValidationError):
-            result[field_name] = [error.errors or error.msg]
+            messages = [error.errors or error.msg]
         else:
-            result[field_name] = [repr(error)]
+            messages = [repr(error)]
+
+        result[field_name] = messages
+        if remaining is not None:
+            remaining -= len(messages)
 
     return result
@@ -0,0 +1,169 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Union, Tuple
+
+from asgiref.sync import async_to_sync
+from django.db import connections
+from django.http import HttpRequest, HttpResponse, HttpResponseNotAllowed, QueryDict
+from django.urls import URLResolver, Resolver404
+from django.urls.resolvers import RegexPattern
+from pydantic import BaseModel, ValidationError as PydanticValidationError
+
+from .constants import HTTP, ContentType
+from .content_negotiation import json_renderer
+from .json_backends import get_json_backend
+
+logger = logging.getLogger(__name__)
+
+BATCH_MAX_ITEMS = 50
+
+
+class BatchItem(BaseModel):
+    method: str = HTTP.GET
+    path: str
+    query: Dict[str, Union[str, List[str]]] = {}
+    body: Any = None
+
+
+class BatchView:
+    """
+    Run list of `{method, path, query, body}` sub-requests against djhug views of one `Routes` instance.
+    Sub-requests share user, session and headers of the batch request and skip middlewares,
+    results are returned in the same order as `{status, body}` items.
+    Thread pool sub-requests use own database connections, so they run in request thread
+    when batch request is in transaction, e.g. with `ATOMIC_REQUESTS` setting.
+    """
+
+    # attributes set by middlewares which are copied to sub-requests
+    shared_request_attrs = ("user", "auth", "session", "site", "LANGUAGE_CODE", "_messages")
+
+    def __init__(self, urlpatterns: list, max_workers: Optional[int] = None, max_items: int = BATCH_MAX_ITEMS):
+        self.resolver = URLResolver(RegexPattern(r"^/?"), urlpatterns)
+        self.max_workers = max_workers
+        self.max_items = max_items
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if request.method.upper() != HTTP.POST:
+            return HttpResponseNotAllowed([HTTP.POST])
+
+        items, errors = self.parse_items(request)
+        if errors:
+            return self.render({"errors": errors}, status=400)
+
+        if self.max_workers and len(items) > 1 and not in_transaction():
+            results = list(self.executor.map(lambda item: self.run_in_thread(request, item), items))
+        else:
+            results = [self.run(request, item) for item in items]
+
+        return self.render(results)
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="djhug-batch")
+        return self._executor
+
+    def parse_items(self, request: HttpRequest) -> Tuple[List[BatchItem], Dict[str, List[Union[dict, str]]]]:
+        try:
+            data = get_json_backend().loads(request.body)
+        except Exception:
+            return [], {"__root__": ["Invalid JSON"]}
+
+        if not isinstance(data, list):
+            return [], {"__root__": ["Batch request must be a list"]}
+        if len(data) > self.max_items:
+            return [], {"__root__": ["Batch request can't have more than %d items" % self.max_items]}
+
+        items, errors = [], {}
+        for i, item in enumerate(data):
+            try:
+                items.append(BatchItem.parse_obj(item))
+            except PydanticValidationError as e:
+                errors[str(i)] = e.errors()
+
+        return items, errors
+
+    def run_in_thread(self, request: HttpRequest, item: BatchItem) -> dict:
+        try:
+            return self.run(request, item)
+        finally:
+            # database connections are thread local, don't leave them opened in pool threads
+            connections.close_all()
+
+    def run(self, request: HttpRequest, item: BatchItem) -> dict:
+        try:
+            match = self.resolver.resolve(item.path)
+        except Resolver404:
+            return {"status": 404, "body": None}
+
+        sub_request = self.create_sub_request(request, item)
+        try:
+            response = match.func(sub_request, *match.args, **match.kwargs)
+            if hasattr(response, "__await__"):
+                response = async_to_sync(_await)(response)
+        except Exception:
+            logger.exception("Batch sub-request %s %s failed", item.method, item.path)
+            return {"status": 500, "body": None}
+
+        return {"status": response.status_code, "body": self.get_response_body(response)}
+
+    def create_sub_request(self, request: HttpRequest, item: BatchItem) -> HttpRequest:
+        body = b""
+        if item.body is not None:
+            body = get_json_backend().dumps(item.body)
+            if isinstance(body, str):
+                body = body.encode()
+
+        query = QueryDict(mutable=True)
+        for key, value in item.query.items():
+            query.setlist(key, value if isinstance(value, list) else [value])
+
+        sub_request = HttpRequest()
+        sub_request.method = item.method.upper()
+        sub_request.path = sub_request.path_info = "/" + item.path.lstrip("/")
+        sub_request.META = {
+            **request.META,
+            "REQUEST_METHOD": sub_request.method,
+            "PATH_INFO": sub_request.path_info,
+            "QUERY_STRING": query.urlencode(),
+            "CONTENT_TYPE": ContentType.JSON,
+            "CONTENT_LENGTH": str(len(body)),
+            "HTTP_ACCEPT": ContentType.JSON,
+        }
+        sub_request.content_type = ContentType.JSON
+        sub_request.content_params = {}
+        sub_request.GET = query
+        sub_request.COOKIES = request.COOKIES
+        sub_request._body = body
+
+        for attr in self.shared_request_attrs:
+            if hasattr(request, attr):
+                setattr(sub_request, attr, getattr(request, attr))
+
+        return sub_request
+
+    @staticmethod
+    def get_response_body(response: HttpResponse) -> Any:
+        content = b"".join(response.streaming_content) if response.streaming else response.content
+        if not content:
+            return None
+        if response.get("Content-Type", "").startswith(ContentType.JSON):
+            return get_json_backend().loads(content)
+        return content.decode(response.charset)
+
+    @staticmethod
+    def render(content: Any, status: int = 200) -> HttpResponse:
+        return HttpResponse(json_renderer(content), status=status, content_type=ContentType.JSON)
+
+
+def in_transaction() -> bool:
+    """ Check if any database connection is in transaction or is configured to run requests in transaction """
+    return any(
+        connection.settings_dict.get("ATOMIC_REQUESTS") or connection.in_atomic_block
+        for connection in connections.all()
+    )
+
+
+async def _await(awaitable):
+    return await awaitable
@@ -0,0 +1,110 @@
+import hashlib
+from dataclasses import dataclass, field
+from typing import Optional, Any, Dict, Iterable, List, Tuple
+
+from django.core.cache import caches
+from django.core.cache.backends.base import BaseCache, DEFAULT_TIMEOUT
+from django.http import HttpResponse
+
+from .constants import HTTP
+
+CACHEABLE_METHODS = (HTTP.GET, HTTP.HEAD)
+CACHEABLE_STATUSES = (200,)
+CACHE_VARY_HEADERS = ("Accept", "Cookie", "Authorization")
+NOT_CACHED_HEADERS = frozenset(("content-type", "content-length", "etag", "vary"))
+
+
+@dataclass
+class CachedResponse:
+    status: int
+    content: bytes
+    content_type: Optional[str]
+    etag: str
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class ResponseCache:
+    """ Rendered responses cache of one view, keyed by raw path arguments, query string, content type and user """
+
+    ttl: Optional[int] = None
+    cache_alias: str = "default"
+    key_prefix: str = "djhug.response"
+
+    hits: int = field(default=0, compare=False)
+    misses: int = field(default=0, compare=False)
+
+    @property
+    def cache(self) -> BaseCache:
+        return caches[self.cache_alias]
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+    def make_key(
+        self,
+        view_path: str,
+        args: Iterable[Any],
+        kwargs: Dict[str, Any],
+        query: Iterable[Tuple[str, List[str]]],
+        content_type: Any,
+        user: Optional[str] = None,
+    ) -> str:
+        arguments = repr((tuple(args), sorted(kwargs.items()), sorted(query), content_type, user))
+        return "%s.%s.%s" % (self.key_prefix, view_path, _md5(arguments.encode()).hexdigest())
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        cached = self.cache.get(key)
+        if cached is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return cached
+
+    def set(self, key: str, response: HttpResponse) -> Optional[CachedResponse]:
+        """ Cache rendered response if it's cacheable """
+        if response.streaming or response.status_code not in CACHEABLE_STATUSES:
+            return None
+
+        cached = CachedResponse(
+            status=response.status_code,
+            content=response.content,
+            content_type=response.get("Content-Type"),
+            etag=make_etag(response.content),
+            headers={name: value for name, value in response.items() if name.lower() not in NOT_CACHED_HEADERS},
+        )
+        self.cache.set(key, cached, timeout=DEFAULT_TIMEOUT if self.ttl is None else self.ttl)
+        return cached
+
+
+def get_cache_user(request) -> Tuple[bool, Optional[str]]:
+    """ Check if request is cacheable and get user part of key, responses of authenticated users aren't shared """
+    user = getattr(request, "user", None)
+    if user is not None and user.is_authenticated:
+        return True, "user:%s" % user.pk
+    if "HTTP_AUTHORIZATION" in request.META:
+        return False, None
+    return True, None
+
+
+def make_etag(content: bytes) -> str:
+    return '"%s"' % _md5(content).hexdigest()
+
+
+def _md5(data: bytes):
+    """ Hash which isn't used for security, so it's available on FIPS systems too """
+    try:
+        return hashlib.md5(data, usedforsecurity=False)
+    except TypeError:  # pragma: no cover, python < 3.9
+        return hashlib.md5(data)
+
+
+def is_not_modified(request, etag: str) -> bool:
+    """ Check if etag matches `If-None-Match` request header """
+    header = request.META.get("HTTP_IF_NONE_MATCH")
+    if not header:
+        return False
+
+    tags = [tag.strip() for tag in header.split(",")]
+    return "*" in tags or etag in tags or "W/%s" % etag in tags
@@ -24,9 +24,23 @@ class ContentType:
     JSON = "application/json"
     FORM = "multipart/form-data"
     FORM_URLENCODED = "application/x-www-form-urlencoded"
+    NDJSON = "application/x-ndjson"
+    CSV = "text/csv"
+    MSGPACK = "application/msgpack"
+    MSGPACK_X = "application/x-msgpack"
+    CBOR = "application/cbor"
+
+
+class ResponseValidation:
+    FULL = "full"
+    TRUSTED = "trusted"
+    SAMPLED = "sampled"
+
+    ALL = (FULL, TRUSTED, SAMPLED)
 
 
 VIEW_ATTR_NAME = "__djhug_options__"
 DIRECTIVE_ATTR_NAME = "__djhug_directive__"
 REQUEST_PARSER_ATTR_NAME = "__djhug_request_parser__"
 RESPONSE_RENDERER_ATTR_NAME = "__djhug_response_renderer__"
+RESPONSE_STREAM_RENDERER_ATTR_NAME = "__djhug_response_stream_renderer__"
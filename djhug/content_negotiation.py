@@ -1,14 +1,38 @@
-import cgi
-import json
-from typing import Callable, Dict, Union, Optional, Iterable
+import codecs
+import csv
+import io
+from functools import lru_cache
+from itertools import islice, chain
+from typing import Callable, Dict, Union, Optional, Iterable, Iterator, Any, List, Tuple
 
 from django.core.serializers.json import DjangoJSONEncoder
 from django.http.request import HttpRequest
+from django.utils import timezone
 
-from djhug.constants import REQUEST_PARSER_ATTR_NAME, RESPONSE_RENDERER_ATTR_NAME, ContentType
+from djhug.constants import (
+    REQUEST_PARSER_ATTR_NAME,
+    RESPONSE_RENDERER_ATTR_NAME,
+    RESPONSE_STREAM_RENDERER_ATTR_NAME,
+    ContentType,
+)
+from djhug.json_backends import get_json_backend
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:  # pragma: no cover
+    cbor2 = None
+
+STREAM_CHUNK_SIZE = 100  # items rendered into one streamed chunk
+ACCEPT_CACHE_SIZE = 256  # distinct Accept headers with cached negotiation result
 
 _global_request_parsers: Dict[str, Callable] = {}
 _global_response_formatters: Dict[str, Callable] = {}
+_global_response_stream_formatters: Dict[str, Callable] = {}
 
 
 def request_parser(content_type: Union[str, Iterable[str]]):
@@ -24,6 +48,22 @@ def response_renderer(content_type: Union[str, Iterable[str]]):
         _register(
             fn, media_type=content_type, storage=_global_response_formatters, attr_name=RESPONSE_RENDERER_ATTR_NAME
         )
+        _negotiate_renderer.cache_clear()
+        return fn
+
+    return wrap
+
+
+def response_stream_renderer(content_type: Union[str, Iterable[str]]):
+    """ Register renderer of items iterator into iterator of response chunks """
+
+    def wrap(fn: Callable):
+        _register(
+            fn,
+            media_type=content_type,
+            storage=_global_response_stream_formatters,
+            attr_name=RESPONSE_STREAM_RENDERER_ATTR_NAME,
+        )
         return fn
 
     return wrap
@@ -62,16 +102,97 @@ def get_request_parser(request: HttpRequest) -> Callable:
 
 def get_response_renderer(request: HttpRequest) -> Optional[Callable]:
     meta = request.META
-    content_type, _ = cgi.parse_header(meta.get("HTTP_ACCEPT", meta.get("Accept")) or "")
-    content_type = content_type.split(",")[0]
+    return _negotiate_renderer(meta.get("HTTP_ACCEPT", meta.get("Accept")) or "")
+
+
+def parse_accept(header: str) -> List[Tuple[str, float]]:
+    """ Parse Accept header into media ranges with q-values, most preferred ranges go first """
+    media_ranges = []
+
+    for index, item in enumerate(header.split(",")):
+        media_range, *params = item.split(";")
+        media_range = media_range.strip().lower()
+        if not media_range:
+            continue
+        if media_range == "*":
+            media_range = "*/*"
 
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = min(max(float(value), 0.0), 1.0)
+                except ValueError:
+                    pass
+
+        specificity = 0 if media_range == "*/*" else 1 if media_range.endswith("/*") else 2
+        media_ranges.append((media_range, quality, specificity, index))
+
+    media_ranges.sort(key=lambda media: (-media[1], -media[2], media[3]))
+    return [(media_range, quality) for media_range, quality, *_ in media_ranges]
+
+
+@lru_cache(maxsize=ACCEPT_CACHE_SIZE)
+def _negotiate_renderer(accept: str) -> Callable:
+    """ Pick registered renderer for Accept header, JSON renderer is used when nothing matches """
     renderers = get_response_renderers()
+    media_ranges = parse_accept(accept)
+    rejected = {media_range for media_range, quality in media_ranges if quality == 0}
+
+    for media_range, quality in media_ranges:
+        if quality == 0:
+            break
+
+        if media_range == "*/*":
+            candidates = [ContentType.JSON, *renderers]
+        elif media_range.endswith("/*"):
+            candidates = [content_type for content_type in renderers if content_type.startswith(media_range[:-1])]
+        else:
+            candidates = [media_range]
+
+        for content_type in candidates:
+            if content_type in renderers and content_type not in rejected and "/" in content_type:
+                return renderers[content_type]
 
-    return renderers.get(content_type) or json_renderer
+    return json_renderer
 
 
 def get_renderer_content_type(renderer: Callable):
-    return getattr(renderer, RESPONSE_RENDERER_ATTR_NAME, None)
+    return _first_media_type(getattr(renderer, RESPONSE_RENDERER_ATTR_NAME, None))
+
+
+def get_response_stream_renderer(renderer: Optional[Callable]) -> Callable:
+    """ Get stream renderer for the same content type as renderer, JSON array stream is used by default """
+    content_type = renderer and get_renderer_content_type(renderer)
+    if isinstance(content_type, (list, tuple)):
+        content_type = content_type[0] if content_type else None
+
+    return _global_response_stream_formatters.get(content_type) or json_stream_renderer
+
+
+def get_stream_renderer_content_type(renderer: Callable):
+    return _first_media_type(getattr(renderer, RESPONSE_STREAM_RENDERER_ATTR_NAME, None))
+
+
+def _first_media_type(media_type: Optional[Union[str, Iterable[str]]]) -> Optional[str]:
+    """ Renderers registered for several media types respond with the first one """
+    if isinstance(media_type, (list, tuple)):
+        return media_type[0] if media_type else None
+    return media_type
+
+
+def _chunks(items: Iterable[Any], size: int = STREAM_CHUNK_SIZE) -> Iterator[list]:
+    items = iter(items)
+    while True:
+        chunk = list(islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _to_bytes(data: Union[str, bytes]) -> bytes:
+    return data if isinstance(data, bytes) else data.encode()
 
 
 @request_parser((ContentType.FORM, ContentType.FORM_URLENCODED))
@@ -81,12 +202,17 @@ def form_parser(request):
 
 @request_parser(ContentType.JSON)
 def json_parser(request):
-    return json.loads(request.body.decode(request.encoding or "utf-8"))
+    body = request.body
+    # json backends decode utf-8 bytes by themselves, don't make an extra str copy of the body
+    if request.encoding and codecs.lookup(request.encoding).name != "utf-8":
+        body = body.decode(request.encoding)
+
+    return get_json_backend().loads(body)
 
 
 @response_renderer(ContentType.JSON)
-def json_renderer(response_data) -> str:
-    return json.dumps(response_data, cls=DjangoJSONEncoder)
+def json_renderer(response_data) -> Union[str, bytes]:
+    return get_json_backend().dumps(response_data)
 
 
 @response_renderer(ContentType.TEXT)
@@ -97,3 +223,90 @@ def plain_renderer(response_data) -> str:
 @response_renderer(ContentType.HTML)
 def html_renderer(response_data) -> str:
     return str(response_data)
+
+
+@response_renderer(ContentType.NDJSON)
+def ndjson_renderer(response_data) -> bytes:
+    if isinstance(response_data, dict):
+        response_data = [response_data]
+    return b"".join(ndjson_stream_renderer(response_data))
+
+
+@response_renderer(ContentType.CSV)
+def csv_renderer(response_data) -> str:
+    if isinstance(response_data, dict):
+        response_data = [response_data]
+    return "".join(csv_stream_renderer(response_data))
+
+
+@response_stream_renderer(ContentType.JSON)
+def json_stream_renderer(items: Iterable[Any]) -> Iterator[bytes]:
+    dumps = get_json_backend().dumps
+    separator = b""
+
+    yield b"["
+    for chunk in _chunks(items):
+        yield separator + b",".join(_to_bytes(dumps(item)) for item in chunk)
+        separator = b","
+    yield b"]"
+
+
+@response_stream_renderer(ContentType.NDJSON)
+def ndjson_stream_renderer(items: Iterable[Any]) -> Iterator[bytes]:
+    dumps = get_json_backend().dumps
+
+    for chunk in _chunks(items):
+        yield b"".join(_to_bytes(dumps(item)) + b"\n" for item in chunk)
+
+
+@response_stream_renderer(ContentType.CSV)
+def csv_stream_renderer(items: Iterable[Any]) -> Iterator[str]:
+    """ Render mappings as rows with header from keys of the first one, other items are rendered as rows as is """
+    items = iter(items)
+    first = next(items, None)
+    if first is None:
+        return
+
+    buffer = io.StringIO()
+    if isinstance(first, dict):
+        writer = csv.DictWriter(buffer, fieldnames=list(first), extrasaction="ignore")
+        writer.writeheader()
+    else:
+        writer = csv.writer(buffer)
+
+    for chunk in _chunks(chain([first], items)):
+        writer.writerows(chunk)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+# binary formats are registered only if optional packages are installed,
+# types not supported by format are encoded the same way as `DjangoJSONEncoder` does
+_default_encoder = DjangoJSONEncoder()
+
+if msgpack is not None:
+
+    @request_parser((ContentType.MSGPACK, ContentType.MSGPACK_X))
+    def msgpack_parser(request):
+        return msgpack.unpackb(request.body, raw=False)
+
+    @response_renderer((ContentType.MSGPACK, ContentType.MSGPACK_X))
+    def msgpack_renderer(response_data) -> bytes:
+        return msgpack.packb(response_data, default=_default_encoder.default)
+
+
+if cbor2 is not None:
+
+    @request_parser(ContentType.CBOR)
+    def cbor_parser(request):
+        return cbor2.loads(request.body)
+
+    @response_renderer(ContentType.CBOR)
+    def cbor_renderer(response_data) -> bytes:
+        # datetime, date, Decimal and UUID have native CBOR tags, naive datetimes are in Django default timezone
+        return cbor2.dumps(
+            response_data,
+            timezone=timezone.get_default_timezone(),
+            default=lambda encoder, value: encoder.encode(_default_encoder.default(value)),
+        )
@@ -0,0 +1,101 @@
+import re
+from typing import Dict, List, Optional, Set
+
+from django.urls import URLResolver, Resolver404
+from django.urls.resolvers import RoutePattern
+
+# converters which match one not empty path segment, other converters (e.g. `path`) can match "/" too
+ONE_SEGMENT_CONVERTERS = frozenset(("str", "int", "slug", "uuid"))
+
+_CONVERTER_SEGMENT_RE = re.compile(r"^<(?:(?P<converter>[^>:]+):)?(?P<parameter>[^>]+)>$")
+
+
+class _Node:
+    __slots__ = ("static", "parameter", "endpoints", "tail")
+
+    def __init__(self):
+        self.static: Dict[str, _Node] = {}
+        self.parameter: Optional[_Node] = None
+        self.endpoints: List[int] = []
+        # routes with segments which can't be matched by the tree, they are checked for all paths under the node
+        self.tail: List[int] = []
+
+
+class RoutesTree:
+    """
+    Prefix tree of `path()` routes split by "/", segments are either static or one-segment converters.
+    It finds candidate routes for a path, candidates are matched by url patterns themselves.
+    """
+
+    def __init__(self):
+        self.root = _Node()
+
+    def add(self, index: int, route: Optional[str]):
+        """ Add route with url pattern index, route is None for regex routes which are checked for every path """
+        node = self.root
+        if route is None:
+            node.tail.append(index)
+            return
+
+        for segment in route.split("/"):
+            if "<" not in segment:
+                node = node.static.setdefault(segment, _Node())
+                continue
+
+            match = _CONVERTER_SEGMENT_RE.match(segment)
+            if match is None or (match.group("converter") or "str") not in ONE_SEGMENT_CONVERTERS:
+                node.tail.append(index)
+                return
+
+            if node.parameter is None:
+                node.parameter = _Node()
+            node = node.parameter
+
+        node.endpoints.append(index)
+
+    def get_candidates(self, path: str) -> List[int]:
+        """ Indexes of routes which can match path, in the order they were added """
+        segments = path.split("/")
+        candidates: Set[int] = set()
+
+        stack = [(self.root, 0)]
+        while stack:
+            node, depth = stack.pop()
+            candidates.update(node.tail)
+
+            if depth == len(segments):
+                candidates.update(node.endpoints)
+                continue
+
+            segment = segments[depth]
+            static = node.static.get(segment)
+            if static is not None:
+                stack.append((static, depth + 1))
+            if node.parameter is not None and segment:
+                stack.append((node.parameter, depth + 1))
+
+        return sorted(candidates)
+
+
+class RoutesTreeResolver(URLResolver):
+    """
+    Resolver of `Routes` url patterns mounted as one pattern, only candidates found by `RoutesTree`
+    are matched instead of all url patterns one by one. Reversing works as for included url patterns.
+    """
+
+    def __init__(self, urlpatterns: list, routes: List[Optional[str]]):
+        super().__init__(RoutePattern(""), urlpatterns)
+        self.tree = RoutesTree()
+        for index, route in enumerate(routes):
+            self.tree.add(index, route)
+
+    def resolve(self, path):
+        path = str(path)
+        urlpatterns = self.url_patterns
+
+        for index in self.tree.get_candidates(path):
+            match = urlpatterns[index].resolve(path)
+            if match:
+                return match
+
+        raise Resolver404({"tried": [[pattern] for pattern in urlpatterns], "path": path})
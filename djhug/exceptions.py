@@ -1,4 +1,4 @@
-from typing import Union, List, Dict, Optional
+from typing import Union, List, Dict, Optional, Tuple
 
 from django.core.exceptions import ImproperlyConfigured
 
@@ -26,6 +26,16 @@ class ValidationError(RequestError):
         super().__init__(self.msg)
 
 
+class MissingArgumentsError(ValidationError):
+    """ Only required arguments are missing, response is the same for the same arguments """
+
+    def __init__(self, names: Tuple[str, ...]):
+        self.names = names
+        super().__init__(
+            {name: [{"loc": [name], "msg": "field required", "type": "value_error.missing"}] for name in names}
+        )
+
+
 class HttpBadRequest(DjhugError):
     status = 400
 
@@ -36,3 +46,7 @@ class HttpNotAllowed(HttpBadRequest):
 
 class HttpNotAcceptable(HttpBadRequest):
     status = 406
+
+
+class HttpPayloadTooLarge(HttpBadRequest):
+    status = 413
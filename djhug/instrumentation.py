@@ -0,0 +1,76 @@
+from time import perf_counter
+from typing import Dict, Optional, Callable, Union
+
+from django.utils.module_loading import import_string
+
+from .settings import Settings
+from .signals import request_timed
+
+TIMINGS_ATTR_NAME = "djhug_timings"
+
+
+class Timings:
+    """ Durations of request processing stages in seconds and payload sizes in bytes """
+
+    __slots__ = ("stages", "sizes", "started")
+
+    def __init__(self):
+        self.stages: Dict[str, float] = {}
+        self.sizes: Dict[str, int] = {}
+        self.started = perf_counter()
+
+    def add(self, stage: str, started: float):
+        """ Add duration of stage started at `started` perf counter value """
+        self.stages[stage] = self.stages.get(stage, 0.0) + perf_counter() - started
+
+    def add_size(self, name: str, size: int):
+        self.sizes[name] = size
+
+    def finish(self):
+        self.stages["total"] = perf_counter() - self.started
+
+    def server_timing(self) -> str:
+        return ", ".join("%s;dur=%.3f" % (stage, duration * 1000) for stage, duration in self.stages.items())
+
+
+class TimingsPublisher:
+    """ Publish timings to configured sinks: `request_timed` signal, settings callback and `Server-Timing` header """
+
+    def __init__(self, signal: bool, callback: Optional[Callable], header: bool):
+        self.signal = signal
+        self.callback = callback
+        self.header = header
+
+    @classmethod
+    def from_settings(cls) -> Optional["TimingsPublisher"]:
+        """ Returns None if timings are disabled """
+        settings = Settings()
+        callback = settings.timings_callback
+        if not (settings.timings_enabled or callback or settings.timings_server_timing_header):
+            return None
+
+        return cls(
+            signal=settings.timings_enabled,
+            callback=_load_callback(callback) if callback else None,
+            header=settings.timings_server_timing_header,
+        )
+
+    def publish(self, request, response, timings: Timings):
+        if not response.streaming:
+            timings.add_size("response", len(response.content))
+        timings.finish()
+
+        if self.header:
+            response["Server-Timing"] = timings.server_timing()
+        if self.callback is not None:
+            self.callback(request=request, response=response, timings=timings)
+        if self.signal:
+            request_timed.send(sender=Timings, request=request, response=response, timings=timings)
+
+
+def get_timings(request) -> Optional[Timings]:
+    return getattr(request, TIMINGS_ATTR_NAME, None)
+
+
+def _load_callback(callback: Union[str, Callable]) -> Callable:
+    return import_string(callback) if isinstance(callback, str) else callback
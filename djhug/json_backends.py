@@ -0,0 +1,87 @@
+import json
+from typing import Any, Union, Optional
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+from .exceptions import ConfigError
+from .settings import Settings
+
+BACKENDS = {
+    "json": "djhug.json_backends.StdlibBackend",
+    "orjson": "djhug.json_backends.OrjsonBackend",
+}
+
+_backend: Optional["JSONBackend"] = None
+
+
+class JSONBackend:
+    """
+    Serialize data to JSON the same way as `DjangoJSONEncoder` does:
+    datetime, date, time, timedelta, Decimal, UUID and lazy strings are supported.
+    """
+
+    def dumps(self, data: Any) -> Union[str, bytes]:
+        raise NotImplementedError
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        raise NotImplementedError
+
+
+class StdlibBackend(JSONBackend):
+    def __init__(self):
+        self.encoder = DjangoJSONEncoder()
+
+    def dumps(self, data: Any) -> str:
+        return self.encoder.encode(data)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonBackend(JSONBackend):
+    def __init__(self):
+        try:
+            import orjson
+        except ImportError:
+            raise ConfigError("orjson json backend requires `orjson` package to be installed")
+
+        self.orjson = orjson
+        # datetime types are passed to `DjangoJSONEncoder` to keep the same formatting
+        self.options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        self.default = DjangoJSONEncoder().default
+
+    def dumps(self, data: Any) -> bytes:
+        return self.orjson.dumps(data, default=self.default, option=self.options)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return self.orjson.loads(data)
+
+
+def get_json_backend() -> JSONBackend:
+    global _backend
+
+    if _backend is None:
+        _backend = load_json_backend(Settings().json_backend)
+
+    return _backend
+
+
+def load_json_backend(name: str) -> JSONBackend:
+    """ Load backend by short name from `BACKENDS` or by dotted path to `JSONBackend` subclass """
+    try:
+        backend_cls = import_string(BACKENDS.get(name, name))
+    except ImportError:
+        raise ConfigError("Unknown json backend %r" % name)
+
+    return backend_cls()
+
+
+@receiver(setting_changed)
+def _reset_json_backend(setting, **_):
+    global _backend
+
+    if setting == "DJHUG_JSON_BACKEND":
+        _backend = None
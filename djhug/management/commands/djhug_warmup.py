@@ -0,0 +1,32 @@
+from django.core.management import BaseCommand, CommandError
+from django.urls import get_resolver
+
+from djhug.exceptions import ConfigError
+from djhug.routes import warmup_urlpatterns
+
+
+class Command(BaseCommand):
+    help = "Import and compile all djhug views of URLconf and report compilation time of every route"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--urlconf", help="URLconf module, ROOT_URLCONF by default")
+        parser.add_argument("--fail-fast", action="store_true", help="stop on the first view which can't be compiled")
+
+    def handle(self, *args, urlconf=None, fail_fast=False, **options):
+        try:
+            results = warmup_urlpatterns(get_resolver(urlconf).url_patterns, fail_fast=fail_fast)
+        except ConfigError as e:
+            raise CommandError(str(e))
+
+        for result in results:
+            line = "%8.2fms  %s  %s" % (result.duration * 1000, result.path, result.view_path)
+            if result.error is None:
+                self.stdout.write(line)
+            else:
+                self.stdout.write(self.style.ERROR("%s  %r" % (line, result.error)))
+
+        errors = sum(result.error is not None for result in results)
+        total = sum(result.duration for result in results) * 1000
+        self.stdout.write("%d routes compiled in %.2fms, %d errors" % (len(results) - errors, total, errors))
+        if errors:
+            raise CommandError("%d routes can't be compiled" % errors)
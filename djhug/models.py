@@ -0,0 +1,317 @@
+import logging
+from collections import abc
+from copy import copy
+from functools import lru_cache, partial
+from itertools import count
+from typing import Type, Optional, Dict, Any, Callable, Union, ForwardRef
+
+from pydantic import BaseModel, ValidationError, create_model
+from pydantic.fields import (
+    SHAPE_SINGLETON,
+    SHAPE_DICT,
+    SHAPE_DEFAULTDICT,
+    SHAPE_MAPPING,
+    SHAPE_LIST,
+    SHAPE_SET,
+    SHAPE_FROZENSET,
+    SHAPE_TUPLE_ELLIPSIS,
+    SHAPE_SEQUENCE,
+    SHAPE_ITERABLE,
+    SHAPE_DEQUE,
+)
+
+from .constants import EMPTY, ResponseValidation
+from .utils import camelcase_text, camelcase, get_model_key_map
+
+try:
+    from typing import get_origin, Literal
+except ImportError:  # pragma: no cover
+    from typing_extensions import get_origin, Literal
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SAMPLE_RATE = 100
+
+_SEQUENCE_SHAPES = (
+    SHAPE_LIST,
+    SHAPE_SET,
+    SHAPE_FROZENSET,
+    SHAPE_TUPLE_ELLIPSIS,
+    SHAPE_SEQUENCE,
+    SHAPE_ITERABLE,
+    SHAPE_DEQUE,
+)
+_MAPPING_SHAPES = (SHAPE_DICT, SHAPE_DEFAULTDICT, SHAPE_MAPPING)
+
+_camelcased_models: Dict[Type[BaseModel], Optional[Type[BaseModel]]] = {}
+
+
+class _CamelcasedConfig:
+    alias_generator = camelcase_text
+    allow_population_by_field_name = True
+
+
+class _NotSupported(Exception):
+    pass
+
+
+def get_camelcased_model(model: Type[BaseModel]) -> Optional[Type[BaseModel]]:
+    """
+    Get subclass of model (and of all nested models) with camelcased fields aliases.
+    It accepts both camelcased and original names and renders camelcased data with `.dict(by_alias=True)`.
+    Returns None for models that can't be aliased: self referencing models, models with explicit aliases
+    and models with mappings, because their keys are camelcased (or underscored) when model isn't aliased.
+    """
+    if model not in _camelcased_models:
+        try:
+            _camelcased_models[model] = _create_camelcased_model(model, in_progress=())
+        except _NotSupported:
+            _camelcased_models[model] = None
+
+    return _camelcased_models[model]
+
+
+def _create_camelcased_model(model: Type[BaseModel], in_progress: tuple) -> Type[BaseModel]:
+    if model in in_progress:
+        raise _NotSupported
+
+    camelcased = _camelcased_models.get(model)
+    if camelcased is not None:
+        return camelcased
+
+    def replace(nested_model):
+        return _create_camelcased_model(nested_model, in_progress=(*in_progress, model))
+
+    namespace = {"__module__": model.__module__, "__qualname__": model.__qualname__, "Config": _CamelcasedConfig}
+    annotations = {}
+
+    for name, field in model.__fields__.items():
+        if field.has_alias or _has_mappings(field.annotation):
+            raise _NotSupported
+
+        annotation = _replace_models(field.annotation, replace)
+        if annotation is not field.annotation:
+            annotations[name] = annotation
+            namespace[name] = copy(field.field_info)
+
+    namespace["__annotations__"] = annotations
+    camelcased = _camelcased_models[model] = type(model.__name__, (model,), namespace)
+    return camelcased
+
+
+def _has_mappings(annotation: Any) -> bool:
+    """ Check if annotation has mappings with arbitrary keys, e.g. `Optional[Dict[str, int]]` or `Any` """
+    if annotation is Any or annotation is dict:
+        return True
+
+    origin = get_origin(annotation)
+    if isinstance(origin, type) and issubclass(origin, abc.Mapping):
+        return True
+    if origin is Literal:
+        return False
+    return any(_has_mappings(arg) for arg in getattr(annotation, "__args__", None) or ())
+
+
+def _replace_models(annotation: Any, replace: Callable[[Type[BaseModel]], Type[BaseModel]]) -> Any:
+    """ Replace models in type annotation, e.g. `Optional[List[Model]]` """
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return replace(annotation)
+    if isinstance(annotation, ForwardRef):
+        raise _NotSupported
+
+    args = getattr(annotation, "__args__", None)
+    origin = get_origin(annotation)
+    if not args or origin is Literal:
+        return annotation
+
+    new_args = tuple(_replace_models(arg, replace) for arg in args)
+    if all(new is old for new, old in zip(new_args, args)):
+        return annotation
+
+    if origin is Union:
+        return Union[new_args]
+    if hasattr(annotation, "copy_with"):
+        return annotation.copy_with(new_args)
+    return origin[new_args]
+
+
+def is_model(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+def is_response_model(annotation: Any) -> bool:
+    """ Check if annotation can be used as response model: model or container of models, e.g. `List[Model]` """
+    if is_model(annotation):
+        return True
+
+    origin = get_origin(annotation)
+    return isinstance(origin, type) and issubclass(origin, abc.Iterable) and _has_models(annotation)
+
+
+def _has_models(annotation: Any) -> bool:
+    return any(is_model(arg) or _has_models(arg) for arg in getattr(annotation, "__args__", None) or ())
+
+
+@lru_cache(maxsize=None)
+def get_root_model(annotation: Any) -> Type[BaseModel]:
+    """ Get model with custom root of annotation type validating whole container at once, created once per type """
+    return create_model(repr(annotation).replace("typing.", ""), __root__=(annotation, ...))
+
+
+def get_container_item(annotation: Any) -> Optional[Any]:
+    """ Type of items of sequence container, e.g. `Model` for `List[Model]` """
+    args = getattr(annotation, "__args__", None)
+    origin = get_origin(annotation)
+    if not args or not isinstance(origin, type):
+        return None
+    if not issubclass(origin, abc.Iterable) or issubclass(origin, abc.Mapping):
+        return None
+    if issubclass(origin, tuple) and (len(args) != 2 or args[1] is not Ellipsis):
+        return None
+    return args[0]
+
+
+@lru_cache(maxsize=None)
+def get_model_serializer(
+    model: Any,
+    camelcased: bool = False,
+    validation: str = ResponseValidation.FULL,
+    sample_rate: int = DEFAULT_SAMPLE_RATE,
+) -> Callable[[Any], Any]:
+    """
+    Get function converting data to python primitives with model fields, created once per model.
+    Data is validated by model in `full` mode, in `trusted` mode only model fields are taken from data
+    without validation, `sampled` mode validates one of `sample_rate` responses and logs mismatches.
+    Generic containers of models, e.g. `List[Model]` or `Dict[str, Model]`, are serialized with root model.
+    """
+    if not is_model(model):
+        return _get_container_serializer(model, camelcased, validation, sample_rate)
+
+    if validation == ResponseValidation.TRUSTED:
+        return _get_trusted_serializer(model, camelcased)
+    if validation == ResponseValidation.SAMPLED:
+        return _get_sampled_serializer(model, camelcased, sample_rate)
+
+    if camelcased:
+        camelcased_model = get_camelcased_model(model)
+        if camelcased_model is not None:
+            return lambda content: camelcased_model(**content).dict(by_alias=True)
+
+        key_map = get_model_key_map(model, camelcase_text)
+        return lambda content: camelcase(model(**content).dict(), key_map=key_map)
+
+    return lambda content: model(**content).dict()
+
+
+def _get_container_serializer(
+    annotation: Any, camelcased: bool, validation: str, sample_rate: int
+) -> Callable[[Any], Any]:
+    root_model = get_root_model(annotation)
+    serialize = get_model_serializer(root_model, False, validation, sample_rate)
+
+    # root field can't be aliased, so container data is camelcased after serialization
+    if camelcased:
+        key_map = get_model_key_map(root_model, camelcase_text)
+        return lambda content: camelcase(serialize({"__root__": content})["__root__"], key_map=key_map)
+
+    return lambda content: serialize({"__root__": content})["__root__"]
+
+
+def _get_trusted_serializer(model: Type[BaseModel], camelcased: bool) -> Callable[[Any], Any]:
+    serialize = _get_fields_filter(model)
+    if camelcased:
+        key_map = get_model_key_map(model, camelcase_text)
+        return lambda content: camelcase(serialize(content), key_map=key_map)
+    return serialize
+
+
+def _get_sampled_serializer(model: Type[BaseModel], camelcased: bool, sample_rate: int) -> Callable[[Any], Any]:
+    validate = get_model_serializer(model, camelcased)
+    trust = _get_trusted_serializer(model, camelcased)
+    counter = count()
+
+    def serialize(content):
+        if next(counter) % sample_rate:
+            return trust(content)
+
+        # validated response is only compared, response is always the same as in `trusted` mode
+        result = trust(content)
+        try:
+            validated = validate(content)
+        except (ValidationError, TypeError) as e:
+            logger.warning("Response doesn't match model %s: %s", model.__name__, e)
+            return result
+
+        if validated != result:
+            logger.warning("Response differs from validated by model %s: %r != %r", model.__name__, result, validated)
+        return result
+
+    return serialize
+
+
+@lru_cache(maxsize=None)
+def _get_fields_filter(model: Type[BaseModel]) -> Callable[[Any], Optional[dict]]:
+    """ Get function taking model fields from mapping or object without validation, nested models included """
+    plan = []
+    for name, field in model.__fields__.items():
+        nested = field.type_ if is_model(field.type_) else None
+        if nested is not None and field.shape not in (SHAPE_SINGLETON, *_SEQUENCE_SHAPES, *_MAPPING_SHAPES):
+            nested = None
+        # models in other annotations, e.g. `List[Union[A, B]]`, are converted with `.dict()`
+        convert = nested is None and _may_have_models(field.outer_type_)
+        plan.append((name, field.alias, field, nested, field.shape, convert))
+
+    def serialize(content) -> Optional[dict]:
+        if content is None:
+            return None
+        if isinstance(content, BaseModel):
+            content = content.__dict__
+        get = content.get if isinstance(content, abc.Mapping) else partial(getattr, content)
+
+        result = {}
+        for name, alias, field, nested, shape, convert in plan:
+            # data is read by alias as model does, field name is used too e.g. for model instances
+            value = get(alias, EMPTY)
+            if value is EMPTY:
+                value = get(name, EMPTY)
+            if value is EMPTY:
+                if field.required:
+                    continue
+                value = field.get_default()
+
+            if value is not None:
+                if nested is not None:
+                    nested_serialize = _get_fields_filter(nested)
+                    if shape in _SEQUENCE_SHAPES:
+                        value = [nested_serialize(item) for item in value]
+                    elif shape in _MAPPING_SHAPES:
+                        value = {key: nested_serialize(item) for key, item in value.items()}
+                    else:
+                        value = nested_serialize(value)
+                elif convert:
+                    value = _models_to_dicts(value)
+
+            result[name] = value
+
+        return result
+
+    return serialize
+
+
+def _may_have_models(annotation: Any) -> bool:
+    """ Check if values of annotation can have models, e.g. `List[List[Model]]`, `Any` or `dict` """
+    if is_model(annotation) or annotation is Any or annotation in (dict, list, tuple, set, frozenset, object):
+        return True
+    if get_origin(annotation) is Literal:
+        return False
+    return any(_may_have_models(arg) for arg in getattr(annotation, "__args__", None) or ())
+
+
+def _models_to_dicts(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.dict()
+    if isinstance(value, dict):
+        return {key: _models_to_dicts(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_models_to_dicts(item) for item in value]
+    return value
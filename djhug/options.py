@@ -7,8 +7,10 @@ from typing import List, Dict
 from django.http.response import HttpResponse
 
 from .arguments import Spec
-from .constants import VIEW_ATTR_NAME
+from .caching import ResponseCache
+from .constants import VIEW_ATTR_NAME, ResponseValidation
 from .exceptions import ConfigError
+from .models import is_response_model
 from .settings import Settings
 from .utils import decorator_with_arguments
 
@@ -46,6 +48,15 @@ class Options:
 
     camelcased_response_data: bool = False
     underscored_body_data: bool = False
+    fused_validation: bool = False
+
+    response_validation: str = ResponseValidation.FULL
+    response_validation_sample_rate: int = 100
+
+    request_max_body_size: Optional[int] = None
+    query_list_separator: Optional[str] = None
+
+    response_cache: Optional[ResponseCache] = None
 
     def __post_init__(self):
         settings = Settings()
@@ -56,6 +67,14 @@ class Options:
             self.camelcased_response_data = settings.camelcased_response_data
         if settings.underscored_request_data is not None:
             self.underscored_body_data = settings.underscored_request_data
+        if settings.fused_validation is not None:
+            self.fused_validation = settings.fused_validation
+        if settings.response_validation is not None:
+            self.set_response_validation(settings.response_validation, settings.response_validation_sample_rate)
+        if settings.request_max_body_size is not None:
+            self.request_max_body_size = settings.request_max_body_size
+        if settings.query_list_separator is not None:
+            self.query_list_separator = settings.query_list_separator
 
     @classmethod
     def get_or_contribute(cls, fn: Callable) -> "Options":
@@ -81,7 +100,7 @@ class Options:
         return fn
 
     def add_accepted_methods(self, *methods: str):
-        self.accepted_methods &= set(map(lambda x: str(x).upper(), methods))
+        self.accepted_methods |= set(map(lambda x: str(x).upper(), methods))
 
     def update_headers(self, **headers: str):
         self.response_additional_headers.update(headers)
@@ -96,11 +115,30 @@ class Options:
             raise ConfigError("Response renderer %r must be a callable" % renderer)
         self.response_renderer = renderer
 
-    def set_response_model(self, model: Type[BaseModel]):
-        if not model or not issubclass(model, BaseModel):
-            raise ConfigError("Response model must be subclass of pydantic `BaseModel`")
+    def set_response_model(self, model: Any):
+        if not model or not is_response_model(model):
+            raise ConfigError("Response model must be subclass of pydantic `BaseModel` or container of models")
         self.response_model = model
 
+    def set_response_validation(self, mode: str, sample_rate: Optional[int] = None):
+        if mode not in ResponseValidation.ALL:
+            raise ConfigError("Response validation must be one of %s" % ", ".join(ResponseValidation.ALL))
+        if sample_rate is not None and (not isinstance(sample_rate, int) or sample_rate < 1):
+            raise ConfigError("Response validation sample rate must be positive integer")
+        self.response_validation = mode
+        if sample_rate is not None:
+            self.response_validation_sample_rate = sample_rate
+
+    def set_request_max_body_size(self, size: Optional[int]):
+        if size is not None and (not isinstance(size, int) or size < 0):
+            raise ConfigError("Request max body size must be non-negative integer or None")
+        self.request_max_body_size = size
+
+    def set_query_list_separator(self, separator: Optional[str]):
+        if separator is not None and (not isinstance(separator, str) or not separator):
+            raise ConfigError("Query list separator must be non empty string or None")
+        self.query_list_separator = separator
+
     def set_response_cls(self, response_cls: Type[HttpResponse]):
         self.response_cls = response_cls
 
@@ -126,6 +164,13 @@ def with_underscored_body_data(fn: Callable):
     return fn
 
 
+@decorator_with_arguments
+def with_fused_validation(fn: Callable):
+    """ Validate body model and arguments with one model in one pass """
+    _get_or_contribute(fn).fused_validation = True
+    return fn
+
+
 def with_request_parser(formatter: Callable):
     def wrapper(fn: Callable):
         _get_or_contribute(fn).set_request_parser(formatter)
@@ -134,6 +179,28 @@ def with_request_parser(formatter: Callable):
     return wrapper
 
 
+def with_request_max_body_size(size: Optional[int]):
+    def wrapper(fn: Callable):
+        _get_or_contribute(fn).set_request_max_body_size(size)
+        return fn
+
+    return wrapper
+
+
+@decorator_with_arguments
+def with_query_list_separator(fn: Callable, separator: Optional[str] = ","):
+    """ Split query values of list arguments by separator, e.g. `?id=1,2,3` """
+    _get_or_contribute(fn).set_query_list_separator(separator)
+    return fn
+
+
+@decorator_with_arguments
+def with_response_cache(fn: Callable, ttl: Optional[int] = None, cache: str = "default"):
+    """ Cache rendered responses of GET requests by view arguments values for `ttl` seconds """
+    _get_or_contribute(fn).response_cache = ResponseCache(ttl=ttl, cache_alias=cache)
+    return fn
+
+
 def with_response_renderer(formatter: Callable):
     def wrapper(fn: Callable):
         _get_or_contribute(fn).set_response_renderer(formatter)
@@ -148,3 +215,13 @@ def with_response_additional_headers(headers: dict):
         return fn
 
     return wrapper
+
+
+def with_response_validation(mode: str, sample_rate: Optional[int] = None):
+    """ Validate responses with response model fully, not at all (`trusted`) or one of `sample_rate` (`sampled`) """
+
+    def wrapper(fn: Callable):
+        _get_or_contribute(fn).set_response_validation(mode, sample_rate)
+        return fn
+
+    return wrapper
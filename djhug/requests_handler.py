@@ -1,22 +1,77 @@
+import asyncio
+import inspect
 import logging
-from collections import Mapping
 from functools import wraps
-from typing import Callable, Iterable, TYPE_CHECKING, Optional
-
-from django.http import HttpRequest, HttpResponseNotAllowed, HttpResponse
+from itertools import chain
+from time import perf_counter
+from typing import Any, Callable, Iterable, TYPE_CHECKING, Optional, Mapping, Dict, Iterator, Tuple, List
+
+from django.http import (
+    HttpRequest,
+    HttpResponseNotAllowed,
+    HttpResponse,
+    StreamingHttpResponse,
+    HttpResponseNotModified,
+)
+from asgiref.sync import async_to_sync, sync_to_async
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.cache import patch_vary_headers
 from django.utils.deprecation import MiddlewareMixin
-
-from .arguments import normalize_error_messages, load_value, get_value
-from .constants import VIEW_ATTR_NAME, EMPTY, HTTP
-from .content_negotiation import get_request_parser, get_response_renderer, get_renderer_content_type
-from .exceptions import HttpNotAllowed, DjhugError, HttpNotAcceptable, ValidationError
-from .utils import underscore, camelcase
+from pydantic import BaseModel, ValidationError as PydanticValidationError
+
+from .arguments import normalize_error_messages, ArgumentsResolver, ArgumentsLoader
+from .caching import ResponseCache, CACHEABLE_METHODS, CACHE_VARY_HEADERS, get_cache_user, is_not_modified
+from .constants import VIEW_ATTR_NAME, HTTP
+from .content_negotiation import (
+    get_request_parser,
+    get_response_renderer,
+    get_renderer_content_type,
+    get_response_stream_renderer,
+    get_stream_renderer_content_type,
+)
+from .instrumentation import Timings, TimingsPublisher, TIMINGS_ATTR_NAME, get_timings
+from .exceptions import (
+    ConfigError,
+    HttpNotAllowed,
+    DjhugError,
+    HttpNotAcceptable,
+    ValidationError,
+    HttpPayloadTooLarge,
+    MissingArgumentsError,
+)
+from .models import get_camelcased_model, get_model_serializer, get_container_item, is_model
+from .settings import Settings
+from .utils import underscore, camelcase, underscore_text
 
 if TYPE_CHECKING:
     from .routes import Options
 
+try:
+    from asgiref.sync import markcoroutinefunction
+except ImportError:  # pragma: no cover
+
+    def markcoroutinefunction(func):
+        func._is_coroutine = asyncio.coroutines._is_coroutine
+        return func
+
+
 logger = logging.getLogger(__name__)
 
+ERROR_RESPONSES_CACHE_SIZE = 64
+
+_NO_ITEMS = object()
+
+_handlers: Dict[Callable, "RequestsHandler"] = {}
+
+
+@receiver(setting_changed)
+def _reset_handlers(setting, **_):
+    """ Compiled handlers keep values of `DJHUG_` settings, they're compiled again on next request """
+    if setting.startswith("DJHUG_"):
+        for handler in _handlers.values():
+            handler.compiled = False
+
 
 class RequestsHandler:
     parse_body_for_methods = HTTP.WITH_BODY
@@ -24,22 +79,113 @@ class RequestsHandler:
     def __init__(self, view):
         self.view: Callable = view
         self.opts: "Options" = getattr(view, VIEW_ATTR_NAME)
+        self.compiled = False
 
     @classmethod
-    def create(cls, view: Callable):
-        return wraps(view)(cls(view))
+    def create(cls, view: Callable) -> "RequestsHandler":
+        """ Get handler registered for view or create new one, there is only one handler per view """
+        if isinstance(view, RequestsHandler):
+            return view
+
+        handler = _handlers.get(view)
+        if handler is None:
+            handler_cls = AsyncRequestsHandler if asyncio.iscoroutinefunction(inspect.unwrap(view)) else cls
+            handler = _handlers[view] = wraps(view)(handler_cls(view))
+
+        return handler
+
+    def compile(self):
+        """
+        Precompute per view state used on every request.
+        Called on first request, options can still be changed by decorators until then.
+        """
+        opts = self.opts
+
+        self.response_renderer: Optional[Callable] = opts.response_renderer
+        self.request_parser: Optional[Callable] = opts.request_parser
+        self.response_headers = tuple(opts.response_additional_headers.items())
+        self.accepted_methods = frozenset(opts.accepted_methods)
+        if HTTP.GET in self.accepted_methods:
+            self.accepted_methods |= {HTTP.HEAD}
+        self.allowed_methods = tuple(sorted(self.accepted_methods))  # `Allow` header of 405 responses
+        self.max_body_size: Optional[int] = opts.request_max_body_size
+        self.args = opts.spec.args[1:] if opts.spec else []  # ignore request
+        self.resolver = ArgumentsResolver(
+            self.args, camelcased_data=opts.underscored_body_data, list_separator=opts.query_list_separator
+        )
+
+        self.response_cache: Optional[ResponseCache] = opts.response_cache
+        self.view_path = "%s.%s" % (self.view.__module__, getattr(self.view, "__qualname__", self.view.__name__))
+
+        self.timings_publisher: Optional[TimingsPublisher] = TimingsPublisher.from_settings()
+
+        self.max_errors: Optional[int] = Settings().max_validation_errors
+        self.error_responses: Dict[tuple, Tuple[bytes, Optional[str]]] = {}
+
+        # camelcased body is validated by body model aliased variant without underscoring it first,
+        # view still gets declared body model instance and errors have underscored fields names
+        self.body_model = self.declared_body_model = opts.spec.body_model if opts.spec else None
+        self.underscore_body = opts.underscored_body_data
+        if self.body_model and opts.underscored_body_data:
+            camelcased_body_model = get_camelcased_model(self.body_model)
+            if camelcased_body_model is not None:
+                self.body_model = camelcased_body_model
+                self.underscore_body = False
+
+        # body model is validated by the same model as arguments with fused validation
+        self.loader: Optional[ArgumentsLoader] = opts.spec.loader if opts.spec else None
+        if self.body_model and opts.fused_validation:
+            self.loader = ArgumentsLoader(
+                self.view.__name__, self.args, body_name=opts.spec.body_name, body_model=self.body_model
+            )
+        if self.loader and not self.loader.compiled:
+            self.loader.compile()
+
+        # build response models serializers (and their camelcased variants) before first response
+        for response_model in (opts.response_model, *(opts.responses_map or {}).values()):
+            if response_model:
+                self.get_serializer(response_model)
+
+        # generator views are always streamed, so their items model is known before first response
+        if opts.response_model and inspect.isgeneratorfunction(inspect.unwrap(self.view)):
+            self.get_serializer(self._get_streamed_item_model(opts.response_model))
+
+        self.compiled = True
 
     def process(self, request, *args, **kwargs):
-        renderer = self.opts.response_renderer or get_response_renderer(request)
+        if not self.compiled:
+            self.compile()
+
+        timings = None
+        if self.timings_publisher is not None:
+            timings = Timings()
+            setattr(request, TIMINGS_ATTR_NAME, timings)
+
+        renderer = self.response_renderer or get_response_renderer(request)
 
         try:
+            cache_key = self._get_cache_key(request, args, kwargs, renderer)
             kwargs = self.process_request(request, kwargs)
+
+            if cache_key is not None:
+                response = self._get_cached_response(request, cache_key)
+                if response is not None:
+                    return self._publish_timings(request, response, timings)
+
+            if timings is not None:
+                started = perf_counter()
             response = self.view(request, *args, **kwargs)
+            if timings is not None:
+                timings.add("view", started)
+
             response = self.process_response(request, response, renderer)
+
+            if cache_key is not None:
+                response = self._cache_response(request, cache_key, response)
         except (DjhugError, ValidationError) as e:
             response = self.handle_errors(e, renderer)
 
-        return response
+        return self._publish_timings(request, response, timings)
 
     __call__ = process
 
@@ -47,64 +193,97 @@ class RequestsHandler:
         opts = self.opts
         errors = {}
 
-        if opts.accepted_methods and request.method.upper() not in opts.accepted_methods:
+        if self.accepted_methods and request.method.upper() not in self.accepted_methods:
             raise HttpNotAllowed
 
-        if opts.spec:
-            args = opts.spec.args[1:]  # ignore request
-        else:
-            args = []
-
         body = self._get_request_body(request)
 
-        if opts.spec.body_model:
+        timings = get_timings(request)
+        if timings is not None:
+            started = perf_counter()
+
+        fused_body_name = self.loader.body_name
+        if self.body_model and not fused_body_name:
             try:
-                kwargs[opts.spec.body_name] = opts.spec.body_model.parse_obj(body)
+                kwargs[opts.spec.body_name] = self._get_declared_body(self.body_model.parse_obj(body))
+            except PydanticValidationError as e:
+                errors[opts.spec.body_name] = self._get_body_errors(e.errors())
+                body = {}
             except Exception as e:
                 errors[opts.spec.body_name] = e
                 body = {}
 
-        for arg in args:
-            val = get_value(
-                name=arg.name,
-                path_kwargs=kwargs,
-                request_body=body,
-                query=request.GET.dict(),
-                camelcased_data=self.opts.underscored_body_data,
-            )
-            default = arg.default
+        values, missing, values_errors = self._load_values(request, kwargs, body)
+        for name in missing:
+            errors[name] = ValidationError({"loc": [name], "msg": "field required", "type": "value_error.missing"})
+        if fused_body_name in values:
+            values[fused_body_name] = self._get_declared_body(values[fused_body_name])
+        if fused_body_name in values_errors:
+            values_errors[fused_body_name] = self._get_body_errors(values_errors[fused_body_name])
+        kwargs.update(values)
+        errors.update(values_errors)
 
-            try:
-                if val is EMPTY:
-                    if default is EMPTY:
-                        raise ValidationError(
-                            {"loc": [arg.name], "msg": "field required", "type": "value_error.missing"}
-                        )
-                    else:
-                        continue
-
-                val = load_value(val, arg.type)
-                if val is not EMPTY:
-                    kwargs[arg.name] = val
-            except Exception as e:
-                errors[arg.name] = e
+        if timings is not None:
+            timings.add("validate", started)
 
         if errors:
-            raise ValidationError(normalize_error_messages(errors))
+            if len(missing) == len(errors):
+                raise MissingArgumentsError(tuple(missing[: self.max_errors]))
+            raise ValidationError(normalize_error_messages(errors, max_errors=self.max_errors))
 
         return kwargs
 
+    def _get_declared_body(self, body: BaseModel) -> BaseModel:
+        if self.body_model is self.declared_body_model:
+            return body
+        return self.declared_body_model.construct(_fields_set=body.__fields_set__, **body.__dict__)
+
+    def _get_body_errors(self, errors: List[dict]) -> List[dict]:
+        """ Errors of camelcased body model have fields names as in body, they are reported underscored """
+        if self.body_model is self.declared_body_model:
+            return errors
+        return [
+            {**error, "loc": tuple(underscore_text(loc) if isinstance(loc, str) else loc for loc in error["loc"])}
+            for error in errors
+        ]
+
+    def _load_values(self, request, kwargs, body):
+        body_name = self.loader.body_name
+        # with fused validation body is validated by loader, arguments are looked up only in body which is dict
+        lookup_body = body if not body_name or isinstance(body, dict) else {}
+        values, missing = self.resolver.resolve(path_kwargs=kwargs, query=request.GET, request_body=lookup_body)
+
+        if body_name:
+            values[body_name] = body
+        loaded, values_errors = self.loader.load(values, max_errors=self.max_errors)
+
+        if body_name in values_errors and lookup_body:
+            # arguments aren't taken from invalid body, as with body validated separately
+            values_without_body, missing = self.resolver.resolve(path_kwargs=kwargs, query=request.GET, request_body={})
+            for name in values.keys() - values_without_body.keys() - {body_name}:
+                values_errors.pop(name, None)
+
+        return loaded, missing, values_errors
+
     def _get_request_body(self, request) -> Optional[dict]:
         if request.method.upper() not in self.parse_body_for_methods:
             return {}
 
+        if self.max_body_size is not None:
+            self._check_body_size(request)
+
         content_type = request.content_type
-        parser = self.opts.request_parser or get_request_parser(request)
+        parser = self.request_parser or get_request_parser(request)
 
         if not parser:
             logger.warning("Failed to parse request body, parser for %s is not found", content_type)
             raise HttpNotAcceptable
 
+        timings = get_timings(request)
+        if timings is not None:
+            started = perf_counter()
+            timings.add_size("request", len(request.body))
+
         try:
             body = parser(request)
         except Exception:
@@ -117,13 +296,29 @@ class RequestsHandler:
                 }
             )
 
-        if self.opts.underscored_body_data:
+        if self.underscore_body:
             body = underscore(body)
 
+        if timings is not None:
+            timings.add("parse_body", started)
+
         return body
 
+    def _check_body_size(self, request):
+        """ Reject too big body by Content-Length before reading it, body itself is checked if header is missing """
+        try:
+            size = int(request.META.get("CONTENT_LENGTH") or -1)
+        except ValueError:
+            size = -1
+
+        if size < 0:
+            size = len(request.body)
+
+        if size > self.max_body_size:
+            logger.warning("Request body of %s bytes exceeds %s bytes limit", size, self.max_body_size)
+            raise HttpPayloadTooLarge
+
     def process_response(self, request, response, renderer):
-        opts = self.opts
         status = None
 
         if isinstance(response, tuple) and isinstance(response[0], int):
@@ -132,45 +327,274 @@ class RequestsHandler:
         if not isinstance(response, HttpResponse):
             if status is None:
                 status = 201 if request.method == HTTP.POST else 200
-            response = self._create_response(content=response, status=status, renderer=renderer)
+            response = self._create_response(
+                content=response, status=status, renderer=renderer, timings=get_timings(request)
+            )
 
-        for name, value in opts.response_additional_headers.items():
+        for name, value in self.response_headers:
             response[name] = value
 
         return response
 
-    def _create_response(self, content, status, renderer):
+    def _create_response(self, content, status, renderer, timings: Optional[Timings] = None):
         response_model = self.opts.response_model or (self.opts.responses_map and self.opts.responses_map.get(status))
 
+        if isinstance(content, Iterator):
+            return self._create_streaming_response(content, status, renderer, response_model)
+
+        if timings is not None:
+            started = perf_counter()
+
         if response_model:
-            content = response_model(**content).dict()
+            content = self.get_serializer(response_model)(content)
         elif self.opts.camelcased_response_data:
             content = camelcase(content)
 
+        if timings is not None:
+            timings.add("serialize", started)
+            started = perf_counter()
+
         if not renderer:
             content_type = None
         else:
             content_type = get_renderer_content_type(renderer)
             content = renderer(content)
 
+        if timings is not None:
+            timings.add("render", started)
+
         response_cls = self.opts.response_cls or HttpResponse
         return response_cls(content=content, content_type=content_type, status=status)
 
+    def get_serializer(self, response_model: Any) -> Callable[[Any], Any]:
+        opts = self.opts
+        return get_model_serializer(
+            response_model,
+            opts.camelcased_response_data,
+            opts.response_validation,
+            opts.response_validation_sample_rate,
+        )
+
+    @staticmethod
+    def _get_streamed_item_model(response_model: Any) -> Any:
+        """ Items of `List[Model]` like models are serialized one by one as `Model` """
+        if is_model(response_model):
+            return response_model
+
+        item_model = get_container_item(response_model)
+        if item_model is None:
+            raise ConfigError("Streamed items can't be validated with %r response model" % response_model)
+        return item_model
+
+    def _create_streaming_response(self, items: Iterator, status, renderer, response_model):
+        """ Render items returned by view one by one without collecting them in memory """
+        if response_model:
+            items = map(self.get_serializer(self._get_streamed_item_model(response_model)), items)
+        elif self.opts.camelcased_response_data:
+            items = map(camelcase, items)
+
+        # first item is serialized before response is returned, so its errors fail request as for not streamed data,
+        # errors of next items are raised after response headers are sent and only truncate response body
+        first = next(items, _NO_ITEMS)
+        if first is not _NO_ITEMS:
+            items = chain((first,), items)
+
+        stream_renderer = get_response_stream_renderer(renderer)
+        content_type = get_stream_renderer_content_type(stream_renderer)
+
+        response_cls = self.opts.response_cls or StreamingHttpResponse
+        if issubclass(response_cls, StreamingHttpResponse):
+            return response_cls(streaming_content=stream_renderer(items), content_type=content_type, status=status)
+        return response_cls(content=stream_renderer(items), content_type=content_type, status=status)
+
+    def _publish_timings(self, request, response, timings: Optional[Timings]):
+        if timings is not None:
+            self.timings_publisher.publish(request, response, timings)
+        return response
+
+    def _get_cache_key(self, request, args, kwargs, renderer) -> Optional[str]:
+        """ Key of raw view arguments values, typed values can have `repr` different for every request """
+        if self.response_cache is None or request.method not in CACHEABLE_METHODS:
+            return None
+        cacheable, user = get_cache_user(request)
+        if not cacheable:
+            return None
+        content_type = get_renderer_content_type(renderer)
+        return self.response_cache.make_key(self.view_path, args, kwargs, request.GET.lists(), content_type, user)
+
+    def _get_cached_response(self, request, cache_key: str) -> Optional[HttpResponse]:
+        """ Build response from cache without calling view, `304` is returned if client has the same version """
+        cached = self.response_cache.get(cache_key)
+        if cached is None:
+            return None
+
+        if is_not_modified(request, cached.etag):
+            response = HttpResponseNotModified()
+        else:
+            response_cls = self.opts.response_cls or HttpResponse
+            response = response_cls(content=cached.content, content_type=cached.content_type, status=cached.status)
+            for name, value in cached.headers.items():
+                response[name] = value
+
+        for name, value in self.response_headers:
+            response[name] = value
+        response["ETag"] = cached.etag
+        patch_vary_headers(response, CACHE_VARY_HEADERS)
+
+        return response
+
+    def _cache_response(self, request, cache_key: str, response: HttpResponse) -> HttpResponse:
+        cached = self.response_cache.set(cache_key, response)
+        if cached is None:
+            return response
+
+        if is_not_modified(request, cached.etag):
+            response = HttpResponseNotModified()
+            for name, value in self.response_headers:
+                response[name] = value
+
+        response["ETag"] = cached.etag
+        patch_vary_headers(response, CACHE_VARY_HEADERS)
+        return response
+
     def handle_errors(self, e, renderer):
         # TODO: add custom exceptions formatting
         if isinstance(e, HttpNotAllowed):
-            response = HttpResponseNotAllowed(self.opts.accepted_methods)
-        elif isinstance(e, HttpNotAcceptable):
-            response = HttpResponse(status=406)
+            response = HttpResponseNotAllowed(self.allowed_methods)
+        elif isinstance(e, (HttpNotAcceptable, HttpPayloadTooLarge)):
+            response = HttpResponse(status=e.status)
+        elif isinstance(e, MissingArgumentsError):
+            response = self._create_missing_arguments_response(e, renderer)
         elif isinstance(e, ValidationError):
-            response = self._create_response(content={"errors": e.errors}, renderer=renderer, status=400)
+            response = self._create_errors_response(e.errors, renderer)
         else:
             raise e
 
         return response
 
+    def _create_errors_response(self, errors, renderer):
+        """ Errors are rendered without `response_model`, model from `responses_map` is still used for 400 """
+        if self.opts.responses_map and self.opts.responses_map.get(400):
+            return self._create_response(content={"errors": errors}, renderer=renderer, status=400)
+
+        content = {"errors": errors}
+        if self.opts.camelcased_response_data:
+            content = camelcase(content)
+
+        content_type = None
+        if renderer:
+            content_type = get_renderer_content_type(renderer)
+            content = renderer(content)
+
+        response_cls = self.opts.response_cls or HttpResponse
+        return response_cls(content=content, content_type=content_type, status=400)
+
+    def _create_missing_arguments_response(self, e: MissingArgumentsError, renderer):
+        """ Responses for missing arguments are rendered once per arguments and renderer """
+        key = (e.names, renderer)
+        rendered = self.error_responses.get(key)
+        if rendered is None:
+            response = self._create_errors_response(e.errors, renderer)
+            if len(self.error_responses) < ERROR_RESPONSES_CACHE_SIZE:
+                self.error_responses[key] = (response.content, response.get("Content-Type"))
+            return response
+
+        content, content_type = rendered
+        response_cls = self.opts.response_cls or HttpResponse
+        return response_cls(content=content, content_type=content_type, status=400)
+
+
+class AsyncRequestsHandler(RequestsHandler):
+    """
+    Handler for `async def` views.
+    Requests and responses bigger than thresholds are loaded and rendered in a thread to not block event loop.
+    """
+
+    offload_body_size = 256 * 1024
+    offload_items_count = 1000
+
+    def __init__(self, view):
+        super().__init__(view)
+        markcoroutinefunction(self)
+
+    async def process(self, request, *args, **kwargs):
+        if not self.compiled:
+            self.compile()
+
+        timings = None
+        if self.timings_publisher is not None:
+            timings = Timings()
+            setattr(request, TIMINGS_ATTR_NAME, timings)
+
+        renderer = self.response_renderer or get_response_renderer(request)
+
+        try:
+            cache_key = self._get_cache_key(request, args, kwargs, renderer)
+            if self._is_large_request(request):
+                kwargs = await sync_to_async(self.process_request, thread_sensitive=False)(request, kwargs)
+            else:
+                kwargs = self.process_request(request, kwargs)
+
+            if cache_key is not None:
+                response = await sync_to_async(self._get_cached_response)(request, cache_key)
+                if response is not None:
+                    return self._publish_timings(request, response, timings)
+
+            if timings is not None:
+                started = perf_counter()
+            response = self.view(request, *args, **kwargs)
+            if inspect.isawaitable(response):
+                response = await response
+            if timings is not None:
+                timings.add("view", started)
+
+            if self._is_large_response(response):
+                response = await sync_to_async(self.process_response, thread_sensitive=False)(
+                    request, response, renderer
+                )
+            else:
+                response = self.process_response(request, response, renderer)
+
+            if cache_key is not None:
+                response = await sync_to_async(self._cache_response)(request, cache_key, response)
+        except (DjhugError, ValidationError) as e:
+            response = self.handle_errors(e, renderer)
+
+        return self._publish_timings(request, response, timings)
+
+    __call__ = process
+
+    def _is_large_request(self, request) -> bool:
+        try:
+            return int(request.META.get("CONTENT_LENGTH") or 0) > self.offload_body_size
+        except ValueError:
+            return False
+
+    def _is_large_response(self, response) -> bool:
+        if isinstance(response, tuple) and len(response) == 2 and isinstance(response[0], int):
+            response = response[1]
+        return isinstance(response, (list, tuple, dict)) and len(response) > self.offload_items_count
+
 
 class DjhugMiddleware(MiddlewareMixin):
+    """ Process views with djhug options, under ASGI views are processed with async `process_view` hook """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        if getattr(self, "async_mode", None) or asyncio.iscoroutinefunction(get_response):
+            self.process_view = self.aprocess_view
+
     def process_view(self, request: HttpRequest, view_func: Callable, view_args: Iterable, view_kwargs: Mapping):
         if hasattr(view_func, VIEW_ATTR_NAME):
-            return RequestsHandler(view_func).process(request, *view_args, **view_kwargs)
+            handler = RequestsHandler.create(view_func)
+            if isinstance(handler, AsyncRequestsHandler):
+                # sync hook is used under WSGI only, there is no event loop thread to block
+                return async_to_sync(handler.process)(request, *view_args, **view_kwargs)
+            return handler.process(request, *view_args, **view_kwargs)
+
+    async def aprocess_view(self, request: HttpRequest, view_func: Callable, view_args: Iterable, view_kwargs: Mapping):
+        if hasattr(view_func, VIEW_ATTR_NAME):
+            handler = RequestsHandler.create(view_func)
+            if isinstance(handler, AsyncRequestsHandler):
+                return await handler.process(request, *view_args, **view_kwargs)
+            return await sync_to_async(handler.process)(request, *view_args, **view_kwargs)
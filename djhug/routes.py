@@ -1,16 +1,25 @@
-from typing import List, Callable, Dict, Optional, Any, Type, Set
+import asyncio
+import inspect
+from time import perf_counter
+from typing import List, Callable, Dict, Optional, Any, Type, Set, Iterable, Tuple
 from urllib.parse import urljoin
 
 from dataclasses import dataclass
-from django.http.response import HttpResponse
-from django.urls import path as url_path, re_path
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.http.response import HttpResponse, HttpResponseNotAllowed
+from django.urls import path as url_path, re_path, URLResolver
+from django.utils.decorators import decorator_from_middleware
 from django.utils.module_loading import import_string
 from pydantic import BaseModel
 
-from .constants import HTTP
+from .batch import BatchView, BATCH_MAX_ITEMS
+from .constants import HTTP, VIEW_ATTR_NAME
+from .dispatch import RoutesTreeResolver
 from .exceptions import ConfigError
 from .options import Options
-from .requests_handler import RequestsHandler
+from .requests_handler import RequestsHandler, markcoroutinefunction
+from .settings import Settings
 from .utils import decorator_with_arguments
 
 
@@ -30,16 +39,180 @@ class _RegisteredView:
     name: str
 
 
+@dataclass
+class _BatchEndpoint:
+    path: str
+    name: Optional[str]
+    max_workers: Optional[int]
+    max_items: int
+
+
+@dataclass
+class WarmupResult:
+    path: str
+    view_path: str
+    duration: float
+    error: Optional[Exception] = None
+
+
+# attributes set on view functions by Django decorators which are checked by middlewares
+LAZY_VIEW_ATTRS = frozenset(
+    ("csrf_exempt", "login_required", "login_url", "redirect_field_name", "xframe_options_exempt")
+)
+
+# middlewares checking view attributes: middleware path, attributes (first one turns check off) and their defaults
+MIDDLEWARES_VIEW_ATTRS = (
+    ("django.middleware.csrf.CsrfViewMiddleware", (("csrf_exempt", False),)),
+    (
+        "django.contrib.auth.middleware.LoginRequiredMiddleware",
+        (("login_required", True), ("login_url", None), ("redirect_field_name", None)),
+    ),
+)
+
+
+class LazyView:
+    """
+    Url pattern view which compiles registered djhug view on first call.
+    Attributes set by view decorators, e.g. `csrf_exempt`, are read from view function.
+    """
+
+    def __init__(self, registered_view: _RegisteredView):
+        self.registered_view = registered_view
+        self._view: Optional[RequestsHandler] = None
+
+        # used by `ResolverMatch` for view path, set without loading the view
+        for attr in ("__module__", "__name__", "__qualname__", "__doc__"):
+            setattr(self, attr, getattr(registered_view.view, attr, None))
+
+        if asyncio.iscoroutinefunction(inspect.unwrap(registered_view.view)):
+            markcoroutinefunction(self)
+
+    @property
+    def loaded(self) -> bool:
+        return self._view is not None
+
+    @property
+    def view(self) -> RequestsHandler:
+        if self._view is None:
+            self._view = _load_view(self.registered_view)
+        return self._view
+
+    def __call__(self, request, *args, **kwargs):
+        return self.view(request, *args, **kwargs)
+
+    def __getattr__(self, name: str):
+        # only attributes set on view functions by decorators are looked up, without loading the view,
+        # other lookups (e.g. `view_class` checked by `reverse()`) must not load all lazy views
+        if name not in LAZY_VIEW_ATTRS:
+            raise AttributeError(name)
+        return getattr(self.registered_view.view, name)
+
+    def __repr__(self):
+        return "<LazyView %s>" % self.registered_view.view_path
+
+
+class MethodDispatcher:
+    """
+    Url pattern view of several views registered for the same path, view is chosen by request method.
+    Views accepting any method handle methods without own view, `HEAD` is handled by `GET` view.
+    Middlewares check views attributes (e.g. `csrf_exempt`) on dispatcher, if views have different values
+    dispatcher is exempt from the check and views which aren't are wrapped by the middleware instead.
+    """
+
+    def __init__(self, views: List[Tuple[Callable, dict]], methods: Dict[str, int], default: Optional[int] = None):
+        self.views = views
+        self.methods = methods
+        self.default = default
+        self.allowed_methods = sorted(methods)
+        self.callbacks = self._get_callbacks()
+
+        self.is_async = all(_is_async_view(view) for view, _ in views)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    @classmethod
+    def create(cls, registered_views: List[_RegisteredView], views: List[Callable]) -> "MethodDispatcher":
+        methods = {}
+        default = None
+        for index, registered_view in enumerate(registered_views):
+            accepted_methods = Options.get_or_contribute(registered_view.view).accepted_methods
+            if not accepted_methods:
+                if default is not None:
+                    raise ConfigError("Several views accept any method on path %r" % registered_view.path)
+                default = index
+
+            for method in accepted_methods:
+                if method in methods:
+                    raise ConfigError("Several views accept %s method on path %r" % (method, registered_view.path))
+                methods[method] = index
+
+        if HTTP.GET in methods:
+            methods.setdefault(HTTP.HEAD, methods[HTTP.GET])
+
+        return cls([(view, rv.kwargs) for view, rv in zip(views, registered_views)], methods, default)
+
+    def __call__(self, request, *args, **kwargs):
+        index = self.methods.get(request.method, self.default)
+        if index is None:
+            if self.is_async:
+                return self._not_allowed()
+            return HttpResponseNotAllowed(self.allowed_methods)
+
+        view = self.callbacks[index]
+        view_kwargs = self.views[index][1]
+        if view_kwargs:
+            kwargs = {**kwargs, **view_kwargs}
+        if not self.is_async and _is_async_view(view):
+            return async_to_sync(view)(request, *args, **kwargs)
+        return view(request, *args, **kwargs)
+
+    async def _not_allowed(self):
+        return HttpResponseNotAllowed(self.allowed_methods)
+
+    def _get_callbacks(self) -> List[Callable]:
+        """ Copy views attributes checked by middlewares, or check them per view if they differ """
+        callbacks = [view for view, _ in self.views]
+        for middleware_path, attrs in MIDDLEWARES_VIEW_ATTRS:
+            values = {tuple(getattr(view, attr, default) for attr, default in attrs) for view in callbacks}
+            if len(values) == 1:
+                for (attr, default), value in zip(attrs, values.pop()):
+                    if value != default:
+                        setattr(self, attr, value)
+                continue
+
+            (attr, default), *_ = attrs
+            setattr(self, attr, not default)
+            if middleware_path in settings.MIDDLEWARE:
+                check = decorator_from_middleware(import_string(middleware_path))
+                callbacks = [check(view) if getattr(view, attr, default) == default else view for view in callbacks]
+
+        return callbacks
+
+
+def _is_async_view(view: Callable) -> bool:
+    if isinstance(view, LazyView):
+        view = view.registered_view.view
+    return asyncio.iscoroutinefunction(view) or asyncio.iscoroutinefunction(inspect.unwrap(view))
+
+
 class Routes:
-    __slots__ = ("_registered_views", "_registered_views_paths", "prefix")
+    __slots__ = ("_registered_views", "_registered_views_paths", "_batch_endpoint", "prefix", "lazy", "tree")
 
     _registered_views: List[_RegisteredView]
     _registered_views_paths: Set[str]
+    _batch_endpoint: Optional[_BatchEndpoint]
 
-    def __init__(self, prefix: Optional[str] = None):
+    def __init__(self, prefix: Optional[str] = None, lazy: Optional[bool] = None, tree: bool = False):
+        """
+        Views of `lazy` routes are imported and compiled on first request, `DJHUG_LAZY_ROUTES` by default.
+        Url patterns of `tree` routes are mounted as one pattern which resolves paths with prefix tree.
+        """
         self.prefix = prefix
+        self.lazy = Settings().lazy_routes if lazy is None else lazy
+        self.tree = tree
         self._registered_views = []
         self._registered_views_paths = set()
+        self._batch_endpoint = None
 
     def route(
         self,
@@ -50,11 +223,16 @@ class Routes:
         accept: Optional[str] = None,
         response_model: Optional[Type[BaseModel]] = None,
         response_cls: Optional[Type[HttpResponse]] = None,
+        response_validation: Optional[str] = None,
         **_,
     ):
         def wrap(fn: Callable):
             fn = self._add_djhug_options(
-                fn, accepted_methods=accept, response_model=response_model, response_cls=response_cls
+                fn,
+                accepted_methods=accept,
+                response_model=response_model,
+                response_cls=response_cls,
+                response_validation=response_validation,
             )
             view = _RegisteredView(
                 view=fn,
@@ -73,8 +251,57 @@ class Routes:
 
         return wrap
 
+    def batch_endpoint(
+        self,
+        path: str = "batch/",
+        name: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        max_items: int = BATCH_MAX_ITEMS,
+    ):
+        """
+        Add POST endpoint running list of `{method, path, query, body}` sub-requests against views of these routes.
+        Sub-requests paths are matched with routes paths (prefix included).
+        If `max_workers` is set, they run in thread pool which lives as long as the process, with their own
+        database connections outside of batch request transaction, unless transaction is used (`ATOMIC_REQUESTS`).
+        """
+        if self._batch_endpoint is not None:
+            raise ConfigError("Batch endpoint already registered")
+
+        self._batch_endpoint = _BatchEndpoint(
+            path=self._form_path(path), name=name, max_workers=max_workers, max_items=max_items
+        )
+
+    def warmup(self, fail_fast: bool = False) -> List[WarmupResult]:
+        """
+        Import and compile all registered views, e.g. before forking workers.
+        Errors are collected in results or raised as `ConfigError` if `fail_fast` is set.
+        """
+        return [
+            _warmup(view.path, view.view_path, lambda: _load_view(view), fail_fast) for view in self._registered_views
+        ]
+
     def get_urlpatterns(self):
-        return [self._create_urlpattern(view) for view in self._registered_views]
+        """ Views registered for the same path share one url pattern dispatching requests by method """
+        groups: Dict[Tuple[str, Callable], List[_RegisteredView]] = {}
+        for view in self._registered_views:
+            groups.setdefault((view.path, view.resolver), []).append(view)
+
+        urlpatterns, routes = [], []
+        for (path, resolver), views in groups.items():
+            urlpatterns.append(self._create_urlpattern(views, lazy=self.lazy))
+            routes.append(None if resolver is re_path else path)
+
+        batch = self._batch_endpoint
+        if batch is not None:
+            view = BatchView(list(urlpatterns), max_workers=batch.max_workers, max_items=batch.max_items)
+            urlpatterns.append(url_path(batch.path, view, name=batch.name))
+
+        if self.tree:
+            if batch is not None:
+                routes.append(batch.path)
+            return [RoutesTreeResolver(urlpatterns, routes)]
+
+        return urlpatterns
 
     def get(
         self,
@@ -84,6 +311,7 @@ class Routes:
         re: bool = False,
         response_model: Optional[Type[BaseModel]] = None,
         response_cls: Optional[Type[HttpResponse]] = None,
+        response_validation: Optional[str] = None,
     ):
         return self.route(
             path=path,
@@ -93,6 +321,7 @@ class Routes:
             accept=HTTP.GET,
             response_model=response_model,
             response_cls=response_cls,
+            response_validation=response_validation,
         )
 
     def post(
@@ -103,6 +332,7 @@ class Routes:
         re: bool = False,
         response_model: Optional[Type[BaseModel]] = None,
         response_cls: Optional[Type[HttpResponse]] = None,
+        response_validation: Optional[str] = None,
     ):
         return self.route(
             path=path,
@@ -112,6 +342,7 @@ class Routes:
             accept=HTTP.POST,
             response_model=response_model,
             response_cls=response_cls,
+            response_validation=response_validation,
         )
 
     def put(
@@ -122,6 +353,7 @@ class Routes:
         re: bool = False,
         response_model: Optional[Type[BaseModel]] = None,
         response_cls: Optional[Type[HttpResponse]] = None,
+        response_validation: Optional[str] = None,
     ):
         return self.route(
             path=path,
@@ -131,6 +363,7 @@ class Routes:
             accept=HTTP.PUT,
             response_model=response_model,
             response_cls=response_cls,
+            response_validation=response_validation,
         )
 
     def patch(
@@ -141,6 +374,7 @@ class Routes:
         re: bool = False,
         response_model: Optional[Type[BaseModel]] = None,
         response_cls: Optional[Type[HttpResponse]] = None,
+        response_validation: Optional[str] = None,
     ):
         return self.route(
             path=path,
@@ -150,6 +384,7 @@ class Routes:
             accept=HTTP.PATCH,
             response_model=response_model,
             response_cls=response_cls,
+            response_validation=response_validation,
         )
 
     def delete(
@@ -160,6 +395,7 @@ class Routes:
         re: bool = False,
         response_model: Optional[Type[BaseModel]] = None,
         response_cls: Optional[Type[HttpResponse]] = None,
+        response_validation: Optional[str] = None,
     ):
         return self.route(
             path=path,
@@ -169,6 +405,7 @@ class Routes:
             accept=HTTP.DELETE,
             response_model=response_model,
             response_cls=response_cls,
+            response_validation=response_validation,
         )
 
     @staticmethod
@@ -177,6 +414,7 @@ class Routes:
         accepted_methods=None,
         response_model: Optional[Type[BaseModel]] = None,
         response_cls: Optional[Type[HttpResponse]] = None,
+        response_validation: Optional[str] = None,
     ):
         fn = Options.register(fn)
         opts = Options.get_or_contribute(fn)
@@ -186,6 +424,8 @@ class Routes:
             opts.set_response_model(response_model)
         if response_cls:
             opts.set_response_cls(response_cls)
+        if response_validation:
+            opts.set_response_validation(response_validation)
         return fn
 
     def _form_path(self, path):
@@ -194,15 +434,70 @@ class Routes:
         return path.lstrip("/")
 
     @staticmethod
-    def _create_urlpattern(registered_view: _RegisteredView):
-        try:
-            # TODO handle same names
-            view = import_string(registered_view.view_path)
-        except ImportError:
-            view = registered_view.view
+    def _create_urlpattern(registered_views: List[_RegisteredView], lazy: bool = False):
+        """ Url pattern of view or of method dispatcher for several views of one path, named by any of them """
+        views = [LazyView(view) if lazy else _load_view(view) for view in registered_views]
 
-        view = RequestsHandler.create(view)
+        first = registered_views[0]
+        if len(views) == 1:
+            return first.resolver(route=first.path, view=views[0], kwargs=first.kwargs, name=first.name)
 
-        return registered_view.resolver(
-            route=registered_view.path, view=view, kwargs=registered_view.kwargs, name=registered_view.name
-        )
+        names = set(view.name for view in registered_views if view.name)
+        if len(names) > 1:
+            raise ConfigError("Views of path %r have different names: %s" % (first.path, ", ".join(sorted(names))))
+
+        dispatcher = MethodDispatcher.create(registered_views, views)
+        return first.resolver(route=first.path, view=dispatcher, name=names.pop() if names else None)
+
+
+def _load_view(registered_view: _RegisteredView) -> RequestsHandler:
+    try:
+        # TODO handle same names
+        view = import_string(registered_view.view_path)
+    except ImportError:
+        view = registered_view.view
+
+    view = RequestsHandler.create(view)
+    if not view.compiled:
+        view.compile()
+    return view
+
+
+def warmup_urlpatterns(urlpatterns: Iterable, fail_fast: bool = False, prefix: str = "") -> List[WarmupResult]:
+    """ Compile djhug views of url patterns, included url patterns are walked recursively """
+    results = []
+    for pattern in urlpatterns:
+        path = prefix + str(pattern.pattern)
+        if isinstance(pattern, URLResolver):
+            results += warmup_urlpatterns(pattern.url_patterns, fail_fast=fail_fast, prefix=path)
+            continue
+
+        callback = pattern.callback
+        views = [view for view, _ in callback.views] if isinstance(callback, MethodDispatcher) else [callback]
+        for view in views:
+            if isinstance(view, LazyView):
+                results.append(_warmup(path, view.registered_view.view_path, lambda: view.view, fail_fast))
+            elif hasattr(view, VIEW_ATTR_NAME):
+                view_path = "%s.%s" % (view.__module__, getattr(view, "__qualname__", view.__name__))
+                results.append(_warmup(path, view_path, lambda: _compile(view), fail_fast))
+
+    return results
+
+
+def _compile(view: Callable):
+    handler = RequestsHandler.create(view)
+    if not handler.compiled:
+        handler.compile()
+
+
+def _warmup(path: str, view_path: str, compile_view: Callable, fail_fast: bool) -> WarmupResult:
+    started = perf_counter()
+    error = None
+    try:
+        compile_view()
+    except Exception as e:
+        if fail_fast:
+            raise ConfigError("Can't compile view %s of route %r: %r" % (view_path, path, e)) from e
+        error = e
+
+    return WarmupResult(path=path, view_path=view_path, duration=perf_counter() - started, error=error)
@@ -1,12 +1,17 @@
 from importlib import import_module
-from typing import Dict, Any, Iterable
+from typing import Dict, Any, Iterable, Callable, Union
 from typing import Optional
 
 from django.conf import settings as global_settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 
 
 class Settings:
+    """ Django settings with `DJHUG_` prefix, read once and shared by all instances until any of them is changed """
+
     __shared_state: Dict[str, Any] = {}
+    _prefix = "djhug_"
 
     response_additional_headers: Optional[Dict[str, str]] = None
 
@@ -15,31 +20,60 @@ class Settings:
 
     camelcased_response_data: bool = False
     underscored_request_data: bool = False
+    fused_validation: bool = False
+
+    json_backend: str = "json"
+
+    lazy_routes: bool = False
+
+    request_max_body_size: Optional[int] = None
+    query_list_separator: Optional[str] = None
+    max_validation_errors: Optional[int] = None
+
+    response_validation: str = "full"
+    response_validation_sample_rate: int = 100
+
+    timings_enabled: bool = False
+    timings_callback: Optional[Union[str, Callable]] = None
+    timings_server_timing_header: bool = False
 
     def __init__(self):
         self.__dict__ = self.__shared_state
 
-        self._prefix = "djhug_"
+        if not self.__shared_state:
+            self._load()
+
+    def _load(self):
+        """ Read all settings first and publish them at once, so concurrent instances never see partial state """
+        state = {}
 
         for var in dir(self.__class__):
             if not var.startswith("_"):
-                try:
-                    final_setting = getattr(global_settings, self._get_setting_name(var))
-                except AttributeError:
-                    pass
-                else:
-                    setattr(self, var, final_setting)
+                state[var] = getattr(global_settings, self._get_setting_name(var), getattr(self.__class__, var))
+
+        state["response_additional_headers"] = state["response_additional_headers"] or {}
 
-        self.response_additional_headers = self.response_additional_headers or {}
+        _bulk_import(state["request_parsers_modules"])
+        _bulk_import(state["response_renderers_modules"])
 
-        _bulk_import(self.request_parsers_modules)
-        _bulk_import(self.response_renderers_modules)
+        self.__shared_state.update(state)
 
     def _get_setting_name(self, setting):
         return ("%s%s" % (self._prefix, setting)).upper()
 
+    @classmethod
+    def reset(cls):
+        """ Read settings again on next instantiation """
+        cls.__shared_state.clear()
+
 
 def _bulk_import(paths: Iterable[str]):
     if paths:
         for path in paths:
             import_module(path)
+
+
+@receiver(setting_changed)
+def _reset_settings(setting, **_):
+    if setting.startswith("DJHUG_"):
+        Settings.reset()
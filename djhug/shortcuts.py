@@ -1,16 +1,24 @@
-from .content_negotiation import request_parser, response_renderer
+from .content_negotiation import request_parser, response_renderer, response_stream_renderer
 from .options import (
     with_request_parser,
     with_response_renderer,
     with_response_additional_headers,
     with_camelcased_response_data,
     with_underscored_body_data,
+    with_fused_validation,
+    with_request_max_body_size,
+    with_query_list_separator,
+    with_response_cache,
+    with_response_validation,
 )
 
 
 class _Request:
     parser = staticmethod(with_request_parser)
     underscored_body = staticmethod(with_underscored_body_data)
+    fused_validation = staticmethod(with_fused_validation)
+    max_body_size = staticmethod(with_request_max_body_size)
+    list_separator = staticmethod(with_query_list_separator)
     register_parser = staticmethod(request_parser)
 
 
@@ -18,8 +26,11 @@ class _Response:
     renderer = staticmethod(with_response_renderer)
     camelcased = staticmethod(with_camelcased_response_data)
     add_headers = staticmethod(with_response_additional_headers)
+    cached = staticmethod(with_response_cache)
+    validation = staticmethod(with_response_validation)
 
     register_renderer = staticmethod(response_renderer)
+    register_stream_renderer = staticmethod(response_stream_renderer)
 
 
 request = _Request()
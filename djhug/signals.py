@@ -0,0 +1,5 @@
+from django.dispatch import Signal
+
+# Sent after request is processed by djhug view if timings are enabled,
+# arguments: request, response, timings (`djhug.instrumentation.Timings` instance)
+request_timed = Signal()
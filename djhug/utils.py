@@ -1,10 +1,12 @@
 import re
-from functools import partial
-from typing import Callable, Union
+from functools import partial, lru_cache
+from typing import Callable, Union, Optional, Dict, Type
 
 import wrapt
+from pydantic import BaseModel
 
 UNDERSCORE = (re.compile("(.)([A-Z][a-z]+)"), re.compile("([a-z0-9])([A-Z])"))
+KEYS_CACHE_SIZE = 4096
 
 
 @wrapt.decorator
@@ -27,32 +29,81 @@ def get_unwrapped_function(fn):
     return fn
 
 
+@lru_cache(maxsize=KEYS_CACHE_SIZE)
 def underscore_text(text: str):
     """Converts text that may be camelcased into an underscored format"""
     return UNDERSCORE[1].sub(r"\1_\2", UNDERSCORE[0].sub(r"\1_\2", text)).lower()
 
 
+@lru_cache(maxsize=KEYS_CACHE_SIZE)
 def camelcase_text(text: str):
     """Converts text that may be underscored into a camelcase format"""
     return text[0] + "".join(text.title().split("_"))[1:]
 
 
-def _transform(content: Union[str, dict, list], transformator):
-    if isinstance(content, dict):
-        new_dictionary = {}
-        for key, value in content.items():
-            if isinstance(key, str):
-                key = transformator(key)
-            new_dictionary[key] = _transform(value, transformator)
-        return new_dictionary
-    elif isinstance(content, list):
-        new_list = []
-        for element in content:
-            new_list.append(_transform(element, transformator))
-        return new_list
-    else:
+def _transform(content: Union[str, dict, list], transformator: Callable, key_map: Optional[Dict[str, str]] = None):
+    """
+    Rename keys of all nested dicts in content.
+    Walks content without recursion so deeply nested data can't hit recursion limit.
+    """
+    if not isinstance(content, (dict, list)):
         return content
 
+    # shared key map isn't changed, keys missing from it are converted once per call with local map
+    get_shared_key = key_map.get if key_map else {}.get
+    local_map = {}
+    get_local_key = local_map.get
+    result = {} if isinstance(content, dict) else []
+    stack = [(content, result)]
+    pop, push = stack.pop, stack.append
+
+    while stack:
+        source, target = pop()
+
+        if isinstance(source, dict):
+            for key, value in source.items():
+                if isinstance(key, str):
+                    new_key = get_shared_key(key) or get_local_key(key)
+                    if new_key is None:
+                        new_key = local_map[key] = transformator(key)
+                    key = new_key
+                if isinstance(value, (dict, list)):
+                    target[key] = new_value = {} if isinstance(value, dict) else []
+                    push((value, new_value))
+                else:
+                    target[key] = value
+        else:
+            for value in source:
+                if isinstance(value, (dict, list)):
+                    new_value = {} if isinstance(value, dict) else []
+                    push((value, new_value))
+                    value = new_value
+                target.append(value)
+
+    return result
+
+
+@lru_cache(maxsize=None)
+def get_model_key_map(model: Type[BaseModel], transformator: Callable) -> Dict[str, str]:
+    """ Transformed names of all fields of model and its nested models, computed once per model """
+    key_map = {}
+    models = [model]
+    seen = set()
+
+    while models:
+        current = models.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+
+        for name, model_field in current.__fields__.items():
+            key_map[name] = transformator(name)
+            for sub_field in [model_field, *(model_field.sub_fields or ())]:
+                if isinstance(sub_field.type_, type) and issubclass(sub_field.type_, BaseModel):
+                    models.append(sub_field.type_)
+
+    return key_map
+
 
 camelcase = partial(_transform, transformator=camelcase_text)
 underscore = partial(_transform, transformator=underscore_text)
@@ -46,6 +46,7 @@ def pytest_configure(config):
             "django.contrib.sessions",
             "django.contrib.sites",
             "django.contrib.staticfiles",
+            "djhug",
         ),
         PASSWORD_HASHERS=("django.contrib.auth.hashers.MD5PasswordHasher",),
     )
@@ -1,11 +1,16 @@
 import json
+from typing import Dict, List, Optional, Set, Tuple
+from unittest.mock import patch
 
 import pytest
+from django.test import override_settings
 from django.http import HttpResponse
-from pydantic import PositiveFloat
+from pydantic import PositiveFloat, BaseModel
 
 import djhug
 from djhug.arguments import Body
+from djhug.exceptions import ConfigError
+from djhug.requests_handler import RequestsHandler
 
 
 def test_simple_get_ok(client, with_urlpatterns, routes: djhug.Routes):
@@ -186,3 +191,266 @@ def test_args_kwargs_ok(client, with_urlpatterns, routes: djhug.Routes):
 
     assert resp.status_code == 200, resp.content
     assert json.loads(resp.content) == {"name": "John", "args": [], "kwargs": {}}
+
+
+def test_camelcased_response_model_ok(client, with_urlpatterns, routes: djhug.Routes):
+    class Item(BaseModel):
+        item_id: int
+
+    class Resp(BaseModel):
+        some_items: List[Item]
+
+    @djhug.response.camelcased
+    @routes.get("test/", response_model=Resp)
+    def view(request):
+        return {"some_items": [{"item_id": 1, "extra_field": 1}], "extra_field": 1}
+
+    with_urlpatterns(list(routes.get_urlpatterns()))
+
+    resp: HttpResponse = client.get("/test/")
+
+    assert resp.status_code == 200, resp.content
+    assert json.loads(resp.content) == {"someItems": [{"itemId": 1}]}
+
+
+@pytest.mark.parametrize("fused", (False, True))
+def test_underscored_body_model_ok(client, with_urlpatterns, routes: djhug.Routes, fused):
+    class Product(BaseModel):
+        product_id: int
+
+    class ReqBody(Body):
+        order_id: int
+        products: List[Product]
+
+    @djhug.request.underscored_body
+    @routes.post("test/")
+    def view(request, body: ReqBody):
+        assert type(body) is ReqBody
+        return body.dict()
+
+    if fused:
+        djhug.request.fused_validation(view)
+
+    with_urlpatterns(list(routes.get_urlpatterns()))
+    assert RequestsHandler.create(view).loader.body_name == ("body" if fused else None)
+
+    resp: HttpResponse = client.post(
+        "/test/", data={"orderId": 1, "products": [{"productId": 2}]}, content_type="application/json"
+    )
+
+    assert resp.status_code == 201, resp.content
+    assert json.loads(resp.content) == {"order_id": 1, "products": [{"product_id": 2}]}
+
+    resp: HttpResponse = client.post(
+        "/test/", data={"orderId": "x", "products": [{"productId": "y"}]}, content_type="application/json"
+    )
+
+    assert resp.status_code == 400, resp.content
+    assert [error["loc"] for error in json.loads(resp.content)["errors"]["body"]] == [
+        ["order_id"],
+        ["products", 0, "product_id"],
+    ]
+
+
+def test_underscored_body_mapping_keys(client, with_urlpatterns, routes: djhug.Routes):
+    class ReqBody(Body):
+        order_id: int
+        extra_data: Dict[str, int]
+
+    @djhug.request.underscored_body
+    @routes.post("test/")
+    def view(request, body: ReqBody):
+        return body.dict()
+
+    with_urlpatterns(list(routes.get_urlpatterns()))
+
+    resp: HttpResponse = client.post(
+        "/test/", data={"orderId": 1, "extraData": {"someKey": 2}}, content_type="application/json"
+    )
+
+    assert resp.status_code == 201, resp.content
+    assert json.loads(resp.content) == {"order_id": 1, "extra_data": {"some_key": 2}}
+
+
+def test_request_max_body_size(client, with_urlpatterns, routes: djhug.Routes):
+    @routes.post("limited/")
+    @djhug.request.max_body_size(20)
+    def limited(request, name: str):
+        return {"name": name}
+
+    @routes.post("unlimited/")
+    def unlimited(request, name: str):
+        return {"name": name}
+
+    with_urlpatterns(list(routes.get_urlpatterns()))
+
+    resp: HttpResponse = client.post("/limited/", data={"name": "x"}, content_type="application/json")
+    assert resp.status_code == 201, resp.content
+
+    resp: HttpResponse = client.post("/limited/", data={"name": "x" * 20}, content_type="application/json")
+    assert resp.status_code == 413, resp.content
+
+    resp: HttpResponse = client.post("/unlimited/", data={"name": "x" * 20}, content_type="application/json")
+    assert resp.status_code == 201, resp.content
+
+
+def test_query_list_arguments(client, with_urlpatterns, routes: djhug.Routes):
+    @routes.get("ids/")
+    def ids(request, id: List[int], tags: Optional[Set[str]] = None, name: str = ""):
+        return {"id": id, "tags": sorted(tags or ()), "name": name}
+
+    @routes.get("separated/")
+    @djhug.request.list_separator
+    def separated(request, id: Tuple[int, ...]):
+        return {"id": id}
+
+    with_urlpatterns(list(routes.get_urlpatterns()))
+
+    resp: HttpResponse = client.get("/ids/?id=1&id=2&id=3&tags=b&tags=a&name=x&name=y")
+    assert resp.status_code == 200, resp.content
+    assert json.loads(resp.content) == {"id": [1, 2, 3], "tags": ["a", "b"], "name": "y"}
+
+    resp: HttpResponse = client.get("/ids/?id=1&id=x")
+    assert resp.status_code == 400, resp.content
+    assert json.loads(resp.content)["errors"]["id"][0]["loc"] == ["__root__", 1]
+
+    resp: HttpResponse = client.get("/separated/?id=1,2&id=3")
+    assert resp.status_code == 200, resp.content
+    assert json.loads(resp.content) == {"id": [1, 2, 3]}
+
+
+def test_missing_arguments_response_reused(client, with_urlpatterns, routes: djhug.Routes):
+    class Response(BaseModel):
+        year: int
+
+    @routes.get("test/", response_model=Response)
+    def view(request, year: int, month: int):
+        return {"year": year}
+
+    with_urlpatterns(list(routes.get_urlpatterns()))
+
+    first: HttpResponse = client.get("/test/")
+    second: HttpResponse = client.get("/test/")
+    assert first.status_code == second.status_code == 400
+    assert first.content == second.content
+    assert json.loads(second.content) == {
+        "errors": {
+            "year": [{"loc": ["year"], "msg": "field required", "type": "value_error.missing"}],
+            "month": [{"loc": ["month"], "msg": "field required", "type": "value_error.missing"}],
+        }
+    }
+    assert len(RequestsHandler.create(view).error_responses) == 1
+
+    resp: HttpResponse = client.get("/test/", {"year": "x"})
+    assert resp.status_code == 400
+    assert set(json.loads(resp.content)["errors"]) == {"year", "month"}
+    assert len(RequestsHandler.create(view).error_responses) == 1
+
+
+def test_max_validation_errors(client, with_urlpatterns, routes: djhug.Routes):
+    @routes.get("test/")
+    def view(request, ids: List[int], year: int):
+        return {"ids": ids}
+
+    with_urlpatterns(list(routes.get_urlpatterns()))
+    url = "/test/?" + "&".join("ids=x%d" % i for i in range(100))
+
+    with override_settings(DJHUG_MAX_VALIDATION_ERRORS=3):
+        resp: HttpResponse = client.get(url)
+    assert resp.status_code == 400
+    errors = json.loads(resp.content)["errors"]
+    assert [error["loc"] for error in errors["ids"]] == [["__root__", 0], ["__root__", 1]]
+    assert errors["year"] == [{"loc": ["year"], "msg": "field required", "type": "value_error.missing"}]
+
+    # compiled handler picks up changed setting
+    errors = json.loads(client.get(url).content)["errors"]
+    assert len(errors["ids"]) == 100
+
+
+def test_fused_validation(client, with_urlpatterns, routes: djhug.Routes):
+    class Order(Body):
+        id: int
+        count: PositiveFloat
+
+    @routes.post("separate/<int:year>/")
+    def separate(request, year: int, order: Order, month: int = 1):
+        return {"year": year, "month": month, "order": order.dict()}
+
+    @routes.post("fused/<int:year>/")
+    @djhug.request.fused_validation
+    def fused(request, year: int, order: Order, month: int = 1):
+        return {"year": year, "month": month, "order": order.dict()}
+
+    with_urlpatterns(list(routes.get_urlpatterns()))
+    assert RequestsHandler.create(fused).loader.body_name == "order"
+    assert RequestsHandler.create(separate).loader.body_name is None
+
+    cases = (
+        ("?month=2", {"id": 1, "count": 2.5}),
+        ("?month=x", {"id": "x", "count": -1}),
+        ("", {"id": "x", "count": 1, "month": "y"}),
+        ("", {"id": 1, "count": 1, "month": "y"}),
+        ("?month=2", [1, 2]),
+        ("?month=2", [["id", 1], ["count", 2]]),
+        ("", "str"),
+        ("?month=x", None),
+    )
+    for query, body in cases:
+        responses = [
+            client.post(path + query, data=json.dumps(body), content_type="application/json")
+            for path in ("/separate/2020/", "/fused/2020/")
+        ]
+        assert responses[0].status_code == responses[1].status_code
+        assert json.loads(responses[0].content) == json.loads(responses[1].content), body
+
+    # fused arguments and body are validated in one pass even if body is invalid
+    loader = RequestsHandler.create(fused).loader
+    with patch.object(loader, "load", wraps=loader.load) as load:
+        client.post("/fused/2020/", data=json.dumps({"id": "x", "month": "y"}), content_type="application/json")
+    assert load.call_count == 1
+
+
+def test_trusted_response_validation(client, with_urlpatterns, routes: djhug.Routes):
+    class Resp(BaseModel):
+        item_id: int
+
+    @routes.get("test/", response_model=Resp, response_validation="trusted")
+    def view(request):
+        return {"item_id": "not validated", "extra_field": 1}
+
+    @djhug.response.validation("sampled", sample_rate=1)
+    @routes.get("sampled/", response_model=Resp)
+    def sampled(request):
+        return {"item_id": "1"}
+
+    with_urlpatterns(list(routes.get_urlpatterns()))
+
+    resp: HttpResponse = client.get("/test/")
+
+    assert resp.status_code == 200, resp.content
+    assert json.loads(resp.content) == {"item_id": "not validated"}
+    assert json.loads(client.get("/sampled/").content) == {"item_id": "1"}
+
+    with pytest.raises(ConfigError):
+        djhug.response.validation("sampled", sample_rate=0)(view)
+
+
+def test_list_response_model(client, with_urlpatterns, routes: djhug.Routes):
+    class Item(BaseModel):
+        item_id: int
+
+    @djhug.response.camelcased
+    @routes.get("test/", response_model=List[Item])
+    def view(request, count: int):
+        return [{"item_id": str(i), "extra_field": 1} for i in range(count)]
+
+    with_urlpatterns(list(routes.get_urlpatterns()))
+
+    resp: HttpResponse = client.get("/test/", {"count": 2})
+
+    assert resp.status_code == 200, resp.content
+    assert json.loads(resp.content) == [{"itemId": 0}, {"itemId": 1}]
+
+    for model in (dict, List[int], Optional[Item]):
+        with pytest.raises(ConfigError):
+            routes.get("other/", response_model=model)(lambda request: None)
@@ -0,0 +1,49 @@
+import asyncio
+import json
+
+from asgiref.sync import iscoroutinefunction
+from django.http import HttpResponse
+
+import djhug
+from djhug.arguments import Body
+from djhug.requests_handler import AsyncRequestsHandler
+
+
+def test_async_view_ok(client, with_urlpatterns, routes: djhug.Routes):
+    @routes.get("<int:year>/")
+    async def view(request, year: int, month: int = 1):
+        await asyncio.sleep(0)
+        return {"year": year, "month": month}
+
+    [pattern] = routes.get_urlpatterns()
+    with_urlpatterns([pattern])
+
+    assert isinstance(pattern.callback, AsyncRequestsHandler)
+    assert iscoroutinefunction(pattern.callback)
+
+    resp: HttpResponse = client.get("/2020/?month=3")
+    assert resp.status_code == 200, resp.content
+    assert json.loads(resp.content) == {"year": 2020, "month": 3}
+
+    resp: HttpResponse = client.get("/2020/?month=march")
+    assert resp.status_code == 400, resp.content
+    assert list(json.loads(resp.content)["errors"]) == ["month"]
+
+
+def test_async_view_offloaded_ok(client, with_urlpatterns, routes: djhug.Routes, monkeypatch):
+    monkeypatch.setattr(AsyncRequestsHandler, "offload_body_size", 10)
+    monkeypatch.setattr(AsyncRequestsHandler, "offload_items_count", 10)
+
+    class Items(Body):
+        ids: list
+
+    @routes.post("test/")
+    async def view(request, body: Items):
+        return 200, [{"id": i} for i in body.ids]
+
+    with_urlpatterns(routes.get_urlpatterns())
+
+    ids = list(range(100))
+    resp: HttpResponse = client.post("/test/", data={"ids": ids}, content_type="application/json")
+    assert resp.status_code == 200, resp.content
+    assert json.loads(resp.content) == [{"id": i} for i in ids]
@@ -0,0 +1,99 @@
+import asyncio
+import json
+import threading
+
+import pytest
+from django.db import transaction
+from django.http import HttpResponse
+
+import djhug
+from djhug.arguments import Body
+
+
+class Item(Body):
+    name: str
+
+
+def post_batch(client, items, path="/api/batch/"):
+    return client.post(path, json.dumps(items), content_type="application/json")
+
+
+def test_batch_endpoint(client, with_urlpatterns):
+    routes = djhug.Routes(prefix="api")
+    routes.batch_endpoint()
+
+    @routes.get("items/<int:item_id>/")
+    def get_item(request, item_id: int, fields: str = "all"):
+        return {"id": item_id, "fields": fields, "user": request.user.is_authenticated}
+
+    @routes.post("items/")
+    def create_item(request, item: Item):
+        return {"name": item.name}
+
+    @routes.get("async/")
+    async def async_view(request, ids: list):
+        await asyncio.sleep(0)
+        return {"ids": ids}
+
+    with_urlpatterns(routes.get_urlpatterns())
+
+    resp: HttpResponse = post_batch(
+        client,
+        [
+            {"path": "/api/items/1/", "query": {"fields": "name"}},
+            {"method": "post", "path": "api/items/", "body": {"name": "x"}},
+            {"method": "post", "path": "api/items/", "body": {}},
+            {"path": "api/unknown/"},
+            {"path": "api/async/", "query": {"ids": ["1", "2"]}},
+        ],
+    )
+    assert resp.status_code == 200, resp.content
+
+    status, *results = json.loads(resp.content)
+    assert status == {"status": 200, "body": {"id": 1, "fields": "name", "user": False}}
+    assert [result["status"] for result in results] == [201, 400, 404, 200]
+    assert results[0]["body"] == {"name": "x"}
+    assert results[-1]["body"] == {"ids": ["1", "2"]}
+
+
+def test_batch_endpoint_thread_pool(client, with_urlpatterns, routes: djhug.Routes):
+    routes.batch_endpoint("batch/", max_workers=4, max_items=10)
+
+    @routes.get("square/<int:value>/")
+    def square(request, value: int):
+        return {"value": value ** 2}
+
+    with_urlpatterns(routes.get_urlpatterns())
+
+    resp: HttpResponse = post_batch(client, [{"path": "square/%d/" % i} for i in range(10)], path="/batch/")
+    assert resp.status_code == 200, resp.content
+    assert [result["body"]["value"] for result in json.loads(resp.content)] == [i ** 2 for i in range(10)]
+
+    resp: HttpResponse = post_batch(client, [{"path": "square/1/"}] * 11, path="/batch/")
+    assert resp.status_code == 400
+
+    resp: HttpResponse = post_batch(client, [{"method": "get"}], path="/batch/")
+    assert resp.status_code == 400
+    assert json.loads(resp.content)["errors"]["0"][0]["loc"] == ["path"]
+
+    resp: HttpResponse = client.get("/batch/")
+    assert resp.status_code == 405
+
+
+@pytest.mark.django_db
+def test_batch_endpoint_in_transaction(client, with_urlpatterns, routes: djhug.Routes):
+    routes.batch_endpoint("batch/", max_workers=4)
+    threads = set()
+
+    @routes.get("thread/")
+    def thread(request):
+        threads.add(threading.get_ident())
+        return {}
+
+    with_urlpatterns(routes.get_urlpatterns())
+
+    with transaction.atomic():
+        resp: HttpResponse = post_batch(client, [{"path": "thread/"}] * 4, path="/batch/")
+
+    assert resp.status_code == 200, resp.content
+    assert threads == {threading.get_ident()}
@@ -0,0 +1,79 @@
+import uuid
+from datetime import datetime, date, timezone
+from decimal import Decimal
+
+import pytest
+from django.http import HttpResponse
+from pydantic import BaseModel
+
+import djhug
+from djhug.arguments import Body
+
+
+class Order(Body):
+    id: uuid.UUID
+    created_at: datetime
+    price: Decimal
+
+
+class OrderResponse(BaseModel):
+    id: uuid.UUID
+    created_at: datetime
+    price: Decimal
+    day: date
+
+
+ORDER_ID = uuid.UUID(int=1)
+
+
+@pytest.fixture
+def orders_url(with_urlpatterns, routes: djhug.Routes):
+    @routes.post("orders/", response_model=OrderResponse)
+    def create_order(request, order: Order):
+        return {**order.dict(), "day": order.created_at.date()}
+
+    with_urlpatterns(routes.get_urlpatterns())
+    return "/orders/"
+
+
+def test_msgpack(client, orders_url):
+    msgpack = pytest.importorskip("msgpack")
+
+    body = msgpack.packb({"id": str(ORDER_ID), "created_at": "2020-01-01T12:00:00", "price": "1.5"})
+    resp: HttpResponse = client.post(
+        orders_url, body, content_type="application/msgpack", HTTP_ACCEPT="application/x-msgpack"
+    )
+    assert resp.status_code == 201, resp.content
+    assert resp["Content-Type"] == "application/msgpack"
+    assert msgpack.unpackb(resp.content) == {
+        "id": str(ORDER_ID),
+        "created_at": "2020-01-01T12:00:00",
+        "price": "1.5",
+        "day": "2020-01-01",
+    }
+
+
+def test_cbor(client, orders_url):
+    cbor2 = pytest.importorskip("cbor2")
+
+    body = cbor2.dumps(
+        {"id": ORDER_ID, "created_at": datetime(2020, 1, 1, 12, tzinfo=timezone.utc), "price": Decimal("1.5")}
+    )
+    resp: HttpResponse = client.post(orders_url, body, content_type="application/cbor", HTTP_ACCEPT="application/cbor")
+    assert resp.status_code == 201, resp.content
+    assert resp["Content-Type"] == "application/cbor"
+
+    data = cbor2.loads(resp.content)
+    assert data["id"] == ORDER_ID
+    assert data["price"] == Decimal("1.5")
+    assert data["day"] == date(2020, 1, 1)
+
+
+def test_binary_validation_errors(client, orders_url):
+    msgpack = pytest.importorskip("msgpack")
+
+    resp: HttpResponse = client.post(
+        orders_url, msgpack.packb({}), content_type="application/msgpack", HTTP_ACCEPT="application/msgpack"
+    )
+    assert resp.status_code == 400
+    assert set(msgpack.unpackb(resp.content)["errors"]["order"][0]) == {"loc", "msg", "type"}
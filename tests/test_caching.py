@@ -0,0 +1,169 @@
+import json
+
+import pytest
+from django.core.cache import caches
+from django.http import HttpResponse
+
+import djhug
+from djhug.caching import ResponseCache
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    caches["default"].clear()
+
+
+def test_cached_response_ok(client, with_urlpatterns, routes: djhug.Routes):
+    calls = []
+
+    @djhug.response.cached(ttl=60)
+    @djhug.response.add_headers({"X-Custom": "1"})
+    @routes.route("test/")
+    def view(request, year: int, month: int = 1):
+        calls.append((year, month))
+        return {"year": year, "month": month}
+
+    with_urlpatterns(routes.get_urlpatterns())
+    response_cache: ResponseCache = view.__djhug_options__.response_cache
+
+    first: HttpResponse = client.get("/test/", {"year": "2020"})
+    second: HttpResponse = client.get("/test/", {"year": "2020"})
+
+    assert first.status_code == second.status_code == 200
+    assert first.content == second.content
+    assert json.loads(second.content) == {"year": 2020, "month": 1}
+    assert first["ETag"] == second["ETag"]
+    assert first["Vary"] == second["Vary"] == "Accept, Cookie, Authorization"
+    assert second["X-Custom"] == "1"
+    assert calls == [(2020, 1)]
+    assert response_cache.stats == {"hits": 1, "misses": 1}
+
+    resp: HttpResponse = client.get("/test/", {"year": "2021"})
+    assert json.loads(resp.content) == {"year": 2021, "month": 1}
+    assert resp["ETag"] != first["ETag"]
+
+    resp: HttpResponse = client.get("/test/", {"year": "2020"}, HTTP_ACCEPT="text/plain")
+    assert resp.content == b"{'year': 2020, 'month': 1}"
+    assert calls == [(2020, 1), (2021, 1), (2020, 1)]
+
+    resp: HttpResponse = client.post("/test/?year=2020")
+    assert resp.status_code == 201
+    assert len(calls) == 4
+    assert response_cache.stats == {"hits": 1, "misses": 3}
+
+    client.get("/test/", {"year": "2020", "unknown": "1"})
+    assert len(calls) == 5
+
+
+def test_cached_response_not_modified(client, with_urlpatterns, routes: djhug.Routes):
+    calls = []
+
+    @djhug.response.cached
+    @routes.get("test/")
+    def view(request, year: int):
+        calls.append(year)
+        return {"year": year}
+
+    with_urlpatterns(routes.get_urlpatterns())
+
+    resp: HttpResponse = client.get("/test/?year=1", HTTP_IF_NONE_MATCH='"outdated"')
+    assert resp.status_code == 200
+    etag = resp["ETag"]
+
+    resp: HttpResponse = client.get("/test/?year=1", HTTP_IF_NONE_MATCH=etag)
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert resp["ETag"] == etag
+    assert calls == [1]
+
+
+def test_cached_errors_not_cached(client, with_urlpatterns, routes: djhug.Routes):
+    calls = []
+
+    @djhug.response.cached()
+    @routes.get("test/")
+    def view(request, year: int):
+        calls.append(year)
+        return 404, {"year": year}
+
+    with_urlpatterns(routes.get_urlpatterns())
+
+    assert client.get("/test/?year=1").status_code == 404
+    assert client.get("/test/?year=1").status_code == 404
+    assert client.get("/test/?year=one").status_code == 400
+    assert calls == [1, 1]
+
+
+def test_cached_response_key_of_raw_values(client, with_urlpatterns, routes: djhug.Routes):
+    class Filter:
+        def __init__(self, value):
+            self.value = value
+
+        @classmethod
+        def __get_validators__(cls):
+            yield cls
+
+    calls = []
+
+    class CustomResponse(HttpResponse):
+        pass
+
+    @djhug.response.cached
+    @routes.get("test/", response_cls=CustomResponse)
+    def view(request, name: Filter):
+        calls.append(name.value)
+        return {"name": name.value}
+
+    with_urlpatterns(routes.get_urlpatterns())
+
+    for _ in range(3):
+        resp = client.get("/test/", {"name": "a"})
+        assert isinstance(resp, CustomResponse)
+        assert json.loads(resp.content) == {"name": "a"}
+
+    assert calls == ["a"]
+
+
+def test_cached_response_keeps_view_headers(client, with_urlpatterns, routes: djhug.Routes):
+    @djhug.response.cached
+    @routes.get("test/")
+    def view(request):
+        response = HttpResponse(b"ok")
+        response["X-View"] = "1"
+        return response
+
+    with_urlpatterns(routes.get_urlpatterns())
+
+    first: HttpResponse = client.get("/test/")
+    second: HttpResponse = client.get("/test/")
+    assert view.__djhug_options__.response_cache.stats == {"hits": 1, "misses": 1}
+    assert first["X-View"] == second["X-View"] == "1"
+
+
+@pytest.mark.django_db
+def test_cached_response_per_user(client, with_urlpatterns, routes: djhug.Routes, django_user_model):
+    calls = []
+
+    @djhug.response.cached
+    @routes.get("test/")
+    def view(request):
+        calls.append(request.user.username)
+        return {"user": request.user.username}
+
+    with_urlpatterns(routes.get_urlpatterns())
+
+    assert json.loads(client.get("/test/").content) == {"user": ""}
+    assert json.loads(client.get("/test/").content) == {"user": ""}
+
+    client.force_login(django_user_model.objects.create(username="first"))
+    assert json.loads(client.get("/test/").content) == {"user": "first"}
+    assert json.loads(client.get("/test/").content) == {"user": "first"}
+
+    client.force_login(django_user_model.objects.create(username="second"))
+    assert json.loads(client.get("/test/").content) == {"user": "second"}
+    assert calls == ["", "first", "second"]
+
+    client.logout()
+    client.get("/test/", HTTP_AUTHORIZATION="Token secret")
+    client.get("/test/", HTTP_AUTHORIZATION="Token secret")
+    assert calls == ["", "first", "second", "", ""]
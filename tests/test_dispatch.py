@@ -0,0 +1,68 @@
+import json
+
+import pytest
+from django.http import HttpResponse
+from django.urls import reverse, resolve, Resolver404, path, include
+
+import djhug
+from djhug.dispatch import RoutesTree, RoutesTreeResolver
+
+
+def test_routes_tree_candidates():
+    tree = RoutesTree()
+    tree.add(0, "items/")
+    tree.add(1, "items/<int:item_id>/")
+    tree.add(2, "items/<slug:slug>/")
+    tree.add(3, "items/latest/")
+    tree.add(4, "files/<path:file_path>")
+    tree.add(5, "items/<int:item_id>.json")
+    tree.add(6, None)
+
+    assert tree.get_candidates("items/") == [0, 5, 6]
+    assert tree.get_candidates("items/latest/") == [1, 2, 3, 5, 6]
+    assert tree.get_candidates("items/10/") == [1, 2, 5, 6]
+    assert tree.get_candidates("items//") == [5, 6]
+    assert tree.get_candidates("files/a/b.txt") == [4, 6]
+    assert tree.get_candidates("other/") == [6]
+
+
+def test_tree_routes(client, with_urlpatterns):
+    routes = djhug.Routes(prefix="api", tree=True)
+
+    @routes.get("items/<int:item_id>/", name="item")
+    def item(request, item_id: int):
+        return {"id": item_id}
+
+    @routes.get("items/<slug:slug>/")
+    def item_by_slug(request, slug: str):
+        return {"slug": slug}
+
+    @routes.get(r"years/(?P<year>[0-9]{4})/$", re=True)
+    def year(request, year: int):
+        return {"year": year}
+
+    urlpatterns = routes.get_urlpatterns()
+    assert len(urlpatterns) == 1
+    assert isinstance(urlpatterns[0], RoutesTreeResolver)
+    with_urlpatterns([path("", include(urlpatterns))])
+
+    resp: HttpResponse = client.get("/api/items/1/")
+    assert resp.status_code == 200
+    assert json.loads(resp.content) == {"id": 1}
+
+    resp: HttpResponse = client.get("/api/items/first/")
+    assert json.loads(resp.content) == {"slug": "first"}
+
+    resp: HttpResponse = client.get("/api/years/2020/")
+    assert json.loads(resp.content) == {"year": 2020}
+
+    assert client.get("/api/items/").status_code == 404
+    assert reverse("item", kwargs={"item_id": 5}) == "/api/items/5/"
+
+    match = resolve("/api/items/5/")
+    assert match.route == "api/items/<int:item_id>/"
+    assert match.kwargs == {"item_id": 5}
+    assert match.url_name == "item"
+
+    with pytest.raises(Resolver404):
+        resolve("/api/items/5")
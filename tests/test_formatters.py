@@ -1,4 +1,4 @@
-from collections import Callable
+from typing import Callable
 
 import pytest
 
@@ -7,6 +7,10 @@ from djhug.constants import REQUEST_PARSER_ATTR_NAME, RESPONSE_RENDERER_ATTR_NAM
 from djhug.content_negotiation import (
     get_request_parsers,
     get_response_renderers,
+    get_response_renderer,
+    parse_accept,
+    json_renderer,
+    _negotiate_renderer,
 )
 
 
@@ -18,6 +22,7 @@ from djhug.content_negotiation import (
     ),
 )
 def test_formatter_decorator(decorator: Callable, get_function: Callable, attr_name: str):
+    registered = dict(get_function())
 
     @decorator("application/json")
     def fn_1(data):
@@ -45,3 +50,50 @@ def test_formatter_decorator(decorator: Callable, get_function: Callable, attr_n
     assert formatters["application/x-msgpack"] == fn_3
     assert formatters["application/bson"] == fn_4
     assert formatters["application/vnd.bson"] == fn_4
+
+    formatters.clear()
+    formatters.update(registered)
+    _negotiate_renderer.cache_clear()
+
+
+def test_parse_accept():
+    assert parse_accept("") == []
+    assert parse_accept("text/html, application/json;q=0.9 ,*/*;q=0.1, text/*, application/xml;q=x") == [
+        ("text/html", 1.0),
+        ("application/xml", 1.0),
+        ("text/*", 1.0),
+        ("application/json", 0.9),
+        ("*/*", 0.1),
+    ]
+
+
+@pytest.mark.parametrize(
+    "accept, content_type",
+    (
+        ("", None),
+        ("application/unknown", None),
+        ("*/*", "application/json"),
+        ("*", "application/json"),
+        ("text/plain", "text/plain"),
+        ("text/plain;q=0.5, text/html", "text/html"),
+        ("text/*", "text/plain"),
+        ("text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8", "text/html"),
+        ("application/json;q=0, */*", "text/plain"),
+        ("application/x-unknown, application/x-ndjson;q=0.5", "application/x-ndjson"),
+    ),
+)
+def test_response_renderer_negotiation(rf, accept, content_type):
+    renderer = get_response_renderers()[content_type] if content_type else json_renderer
+
+    assert get_response_renderer(rf.get("/", HTTP_ACCEPT=accept)) is renderer
+
+
+def test_response_renderer_negotiation_cache_reset(rf):
+    request = rf.get("/", HTTP_ACCEPT="application/x-negotiation-test")
+    assert get_response_renderer(request) is json_renderer
+
+    @response_renderer("application/x-negotiation-test")
+    def fn(data):
+        return data
+
+    assert get_response_renderer(request) is fn
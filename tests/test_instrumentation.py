@@ -0,0 +1,75 @@
+import json
+
+from django.http import HttpResponse
+from django.test import override_settings
+
+import djhug
+from djhug.instrumentation import Timings
+from djhug.requests_handler import RequestsHandler
+from djhug.signals import request_timed
+
+timings_calls = []
+
+
+def timings_callback(request, response, timings):
+    timings_calls.append(timings)
+
+
+def test_timings_disabled(client, with_urlpatterns, routes: djhug.Routes):
+    @routes.get("test/")
+    def view(request, year: int):
+        assert not hasattr(request, "djhug_timings")
+        return {"year": year}
+
+    with_urlpatterns(routes.get_urlpatterns())
+
+    resp: HttpResponse = client.get("/test/", {"year": "2020"})
+    assert resp.status_code == 200
+    assert "Server-Timing" not in resp
+    assert RequestsHandler.create(view).timings_publisher is None
+
+
+def test_timings_callback_and_header(client, with_urlpatterns, routes: djhug.Routes):
+    @routes.post("test/")
+    def view(request, year: int):
+        return {"year": year}
+
+    with override_settings(
+        DJHUG_TIMINGS_CALLBACK="tests.test_instrumentation.timings_callback", DJHUG_TIMINGS_SERVER_TIMING_HEADER=True
+    ):
+        with_urlpatterns(routes.get_urlpatterns())
+
+        timings_calls.clear()
+        resp: HttpResponse = client.post("/test/", json.dumps({"year": 2020}), content_type="application/json")
+        assert resp.status_code == 201
+
+    [timings] = timings_calls
+    assert set(timings.stages) == {"parse_body", "validate", "view", "serialize", "render", "total"}
+    assert timings.sizes == {"request": 14, "response": 14}
+    assert resp["Server-Timing"].startswith("parse_body;dur=")
+
+
+def test_timings_signal(client, with_urlpatterns, routes: djhug.Routes):
+    received = []
+
+    def receiver(sender, request, response, timings, **kwargs):
+        received.append((response.status_code, timings))
+
+    @routes.get("test/")
+    def view(request, year: int):
+        return {"year": year}
+
+    with override_settings(DJHUG_TIMINGS_ENABLED=True):
+        with_urlpatterns(routes.get_urlpatterns())
+
+        request_timed.connect(receiver)
+        try:
+            client.get("/test/", {"year": "wrong"})
+        finally:
+            request_timed.disconnect(receiver)
+
+    [(status, timings)] = received
+    assert status == 400
+    assert isinstance(timings, Timings)
+    assert "view" not in timings.stages
+    assert "total" in timings.stages
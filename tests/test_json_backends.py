@@ -0,0 +1,71 @@
+import json
+from datetime import datetime, date, time, timedelta, timezone
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+from django.test import override_settings
+
+from djhug.content_negotiation import json_renderer, json_parser
+from djhug.exceptions import ConfigError
+from djhug.json_backends import get_json_backend, load_json_backend, StdlibBackend
+
+DATA = {
+    "datetime": datetime(2020, 10, 12, 12, 0, 0, 123456, tzinfo=timezone.utc),
+    "date": date(2020, 10, 12),
+    "time": time(12, 30, 1, 500000),
+    "timedelta": timedelta(days=1, seconds=5),
+    "decimal": Decimal("10.50"),
+    "uuid": UUID("a8098c1a-f86e-11da-bd1a-00112444be1e"),
+    "nested": [{"id": 1}, None, True, 1.5],
+}
+
+EXPECTED = {
+    "datetime": "2020-10-12T12:00:00.123Z",
+    "date": "2020-10-12",
+    "time": "12:30:01.500",
+    "timedelta": "P1DT00H00M05S",
+    "decimal": "10.50",
+    "uuid": "a8098c1a-f86e-11da-bd1a-00112444be1e",
+    "nested": [{"id": 1}, None, True, 1.5],
+}
+
+
+@pytest.mark.parametrize("name", ("json", "orjson", "djhug.json_backends.StdlibBackend"))
+def test_backends_same_semantics(name):
+    if name == "orjson":
+        pytest.importorskip("orjson")
+
+    backend = load_json_backend(name)
+
+    assert json.loads(backend.dumps(DATA)) == EXPECTED
+    assert backend.loads(backend.dumps(EXPECTED)) == EXPECTED
+    assert backend.loads(b'{"key": "\\u0436"}') == {"key": "ж"}
+
+
+def test_unknown_backend():
+    with pytest.raises(ConfigError):
+        load_json_backend("not.existing.Backend")
+
+
+def test_backend_from_settings(rf):
+    pytest.importorskip("orjson")
+
+    assert isinstance(get_json_backend(), StdlibBackend)
+
+    with override_settings(DJHUG_JSON_BACKEND="orjson"):
+        assert isinstance(json_renderer(DATA), bytes)
+        assert json.loads(json_renderer(DATA)) == EXPECTED
+
+        request = rf.post("/", data=b'{"id": 1}', content_type="application/json")
+        assert json_parser(request) == {"id": 1}
+
+    assert isinstance(get_json_backend(), StdlibBackend)
+    assert isinstance(json_renderer(DATA), str)
+
+
+def test_json_parser_request_encoding(rf):
+    request = rf.post("/", data='{"name": "ж"}'.encode("cp1251"), content_type="application/json")
+    request.encoding = "cp1251"
+
+    assert json_parser(request) == {"name": "ж"}
@@ -0,0 +1,68 @@
+import json
+
+from django.http import HttpResponse
+from django.test import override_settings
+from django.urls import resolve, reverse
+from django.views.decorators.csrf import csrf_exempt
+
+import djhug
+from djhug.routes import LazyView
+
+
+def test_lazy_routes(client, with_urlpatterns):
+    routes = djhug.Routes(lazy=True)
+
+    @routes.get("<int:year>/")
+    def view(request, year: int, month: int = 1):
+        return {"year": year, "month": month}
+
+    @routes.post("async/")
+    async def async_view(request, name: str):
+        return {"name": name}
+
+    urlpatterns = routes.get_urlpatterns()
+    with_urlpatterns(urlpatterns)
+
+    lazy_view, lazy_async_view = [pattern.callback for pattern in urlpatterns]
+    assert isinstance(lazy_view, LazyView)
+    assert not lazy_view.loaded
+    assert not view.__djhug_options__.spec.loader.compiled
+    assert resolve("/2020/")._func_path == "tests.test_lazy_routes.view"
+
+    resp: HttpResponse = client.get("/2020/", {"month": "2"})
+    assert resp.status_code == 200, resp.content
+    assert json.loads(resp.content) == {"year": 2020, "month": 2}
+    assert lazy_view.loaded
+    assert view.__djhug_options__.spec.loader.compiled
+
+    resp: HttpResponse = client.post("/async/", {"name": "x"}, content_type="application/json")
+    assert resp.status_code == 201, resp.content
+    assert lazy_async_view.loaded and lazy_async_view.view.compiled
+
+
+def test_lazy_routes_reverse(with_urlpatterns):
+    routes = djhug.Routes(lazy=True)
+
+    @routes.get("<int:year>/", name="lazy-year")
+    @csrf_exempt
+    def view(request, year: int):
+        return {"year": year}
+
+    @routes.get("other/", name="lazy-other")
+    def other(request):
+        return {}
+
+    urlpatterns = routes.get_urlpatterns()
+    with_urlpatterns(urlpatterns)
+
+    assert reverse("lazy-year", kwargs={"year": 2020}) == "/2020/"
+    assert reverse("lazy-other") == "/other/"
+    assert urlpatterns[0].callback.csrf_exempt
+    assert not hasattr(urlpatterns[1].callback, "view_class")
+    assert [pattern.callback.loaded for pattern in urlpatterns] == [False, False]
+
+
+def test_lazy_routes_setting():
+    with override_settings(DJHUG_LAZY_ROUTES=True):
+        assert djhug.Routes().lazy
+    assert not djhug.Routes().lazy
@@ -0,0 +1,176 @@
+import json
+
+import pytest
+from django.http import HttpResponse
+from django.test import Client, override_settings
+from django.urls import reverse
+from django.views.decorators.csrf import csrf_exempt
+
+import djhug
+from djhug.arguments import Body
+from djhug.exceptions import ConfigError
+from djhug.routes import MethodDispatcher
+
+
+class Item(Body):
+    name: str
+
+
+@pytest.mark.parametrize("lazy", (False, True))
+def test_method_dispatch(client, with_urlpatterns, lazy):
+    routes = djhug.Routes(lazy=lazy)
+
+    @routes.get("items/<int:item_id>/", name="item")
+    def get_item(request, item_id: int):
+        return {"id": item_id}
+
+    @routes.put("items/<int:item_id>/", kwargs={"source": "api"})
+    def update_item(request, item_id: int, item: Item, source: str):
+        return {"id": item_id, "name": item.name, "source": source}
+
+    @routes.delete("items/<int:item_id>/")
+    async def delete_item(request, item_id: int):
+        return 204, None
+
+    urlpatterns = routes.get_urlpatterns()
+    assert len(urlpatterns) == 1
+    assert isinstance(urlpatterns[0].callback, MethodDispatcher)
+    with_urlpatterns(urlpatterns)
+
+    assert reverse("item", kwargs={"item_id": 1}) == "/items/1/"
+
+    resp: HttpResponse = client.get("/items/1/")
+    assert resp.status_code == 200
+    assert json.loads(resp.content) == {"id": 1}
+
+    resp: HttpResponse = client.put("/items/1/", {"name": "x"}, content_type="application/json")
+    assert resp.status_code == 200, resp.content
+    assert json.loads(resp.content) == {"id": 1, "name": "x", "source": "api"}
+
+    assert client.delete("/items/1/").status_code == 204
+    assert client.head("/items/1/").status_code == 200
+
+    resp: HttpResponse = client.post("/items/1/")
+    assert resp.status_code == 405
+    assert resp["Allow"] == "DELETE, GET, HEAD, PUT"
+
+
+def test_method_dispatch_default_view(client, with_urlpatterns, routes: djhug.Routes):
+    @routes.get("items/")
+    def list_items(request):
+        return []
+
+    @routes.route("items/")
+    def any_method(request):
+        return {"method": request.method}
+
+    with_urlpatterns(routes.get_urlpatterns())
+
+    assert json.loads(client.get("/items/").content) == []
+    assert json.loads(client.patch("/items/", {}, content_type="application/json").content) == {"method": "PATCH"}
+
+
+@pytest.mark.parametrize("tree", (False, True))
+def test_method_dispatch_names(client, with_urlpatterns, tree):
+    routes = djhug.Routes(tree=tree)
+
+    @routes.get("items/", name="items")
+    def list_items(request):
+        return []
+
+    @routes.post("items/")
+    def create_item(request, item: Item):
+        return item.dict()
+
+    @routes.put("items/", name="items")
+    def replace_items(request):
+        return []
+
+    urlpatterns = routes.get_urlpatterns()
+    with_urlpatterns(urlpatterns)
+
+    assert reverse("items") == "/items/"
+    assert client.post(reverse("items"), {"name": "x"}, content_type="application/json").status_code == 201
+    assert client.put(reverse("items"), {}, content_type="application/json").status_code == 200
+
+
+def test_method_dispatch_different_names(routes: djhug.Routes):
+    @routes.get("items/", name="items-list")
+    def list_items(request):
+        return []
+
+    @routes.post("items/", name="items-create")
+    def create_item(request):
+        return {}
+
+    with pytest.raises(ConfigError, match="Views of path 'items/' have different names: items-create, items-list"):
+        routes.get_urlpatterns()
+
+
+@pytest.mark.parametrize("lazy", (False, True))
+def test_method_dispatch_csrf(with_urlpatterns, lazy):
+    routes = djhug.Routes(lazy=lazy)
+
+    @routes.post("items/")
+    def create_item(request):
+        return {}
+
+    @routes.put("items/")
+    @csrf_exempt
+    def replace_items(request):
+        return {}
+
+    @routes.delete("items/")
+    @csrf_exempt
+    def delete_items(request):
+        return {}
+
+    client = Client(enforce_csrf_checks=True)
+    with override_settings(MIDDLEWARE=["django.middleware.csrf.CsrfViewMiddleware"]):
+        with_urlpatterns(routes.get_urlpatterns())
+
+        assert client.post("/items/", {}, content_type="application/json").status_code == 403
+        assert client.put("/items/", {}, content_type="application/json").status_code == 200
+        assert client.delete("/items/").status_code == 200
+
+
+def test_method_dispatch_same_attributes(routes: djhug.Routes):
+    @routes.post("items/")
+    @csrf_exempt
+    def create_item(request):
+        return {}
+
+    @routes.put("items/")
+    @csrf_exempt
+    def replace_items(request):
+        return {}
+
+    [pattern] = routes.get_urlpatterns()
+    assert pattern.callback.csrf_exempt
+    assert not hasattr(pattern.callback, "login_required")
+    assert pattern.callback.callbacks == [view for view, _ in pattern.callback.views]
+
+
+def test_method_dispatch_conflict(routes: djhug.Routes):
+    @routes.get("items/")
+    def list_items(request):
+        return []
+
+    @routes.get("items/")
+    def list_other_items(request):
+        return []
+
+    with pytest.raises(ConfigError, match="Several views accept GET method"):
+        routes.get_urlpatterns()
+
+
+def test_not_accepted_method(client, with_urlpatterns, routes: djhug.Routes):
+    @routes.post("items/")
+    def create_item(request):
+        return {}
+
+    with_urlpatterns(routes.get_urlpatterns())
+
+    resp: HttpResponse = client.get("/items/")
+    assert resp.status_code == 405
+    assert resp["Allow"] == "POST"
@@ -0,0 +1,192 @@
+from typing import List, Optional, Dict, Union
+
+import pytest
+from pydantic import BaseModel, Field, validator, ValidationError
+
+from djhug.models import get_camelcased_model, get_model_serializer, get_root_model
+
+
+class Item(BaseModel):
+    item_id: int
+
+
+class Box(BaseModel):
+    box_name: str = Field("box", alias="title")
+    main_item: Optional[Item]
+    items_list: List[Item] = []
+    items_map: Dict[str, List[Optional[Item]]] = {}
+
+    @validator("items_list")
+    def check_items(cls, value):
+        if len(value) > 2:
+            raise ValueError("too many items")
+        return value
+
+
+class Shelf(BaseModel):
+    shelf_name: str = "shelf"
+    main_item: Optional[Item]
+    items_list: List[Item] = []
+
+    @validator("items_list")
+    def check_items(cls, value):
+        if len(value) > 2:
+            raise ValueError("too many items")
+        return value
+
+
+class Tree(BaseModel):
+    node_name: str
+    child_nodes: List["Tree"] = []
+
+
+Tree.update_forward_refs()
+
+
+def test_camelcased_model_ok():
+    model = get_camelcased_model(Shelf)
+
+    assert issubclass(model, Shelf)
+    assert get_camelcased_model(Shelf) is model
+    assert Shelf.__fields__["main_item"].alias == "main_item"
+
+    shelf = model(mainItem={"itemId": 1}, items_list=[{"item_id": 2}])
+
+    assert shelf.dict() == {"shelf_name": "shelf", "main_item": {"item_id": 1}, "items_list": [{"item_id": 2}]}
+    assert shelf.dict(by_alias=True) == {"shelfName": "shelf", "mainItem": {"itemId": 1}, "itemsList": [{"itemId": 2}]}
+
+    with pytest.raises(ValidationError):
+        model(itemsList=[{"itemId": 1}] * 3)
+
+
+def test_aliased_model_not_camelcased():
+    # explicit aliases and mappings keys are camelcased as field names and dict keys
+    assert get_camelcased_model(Box) is None
+
+    content = {"title": "big", "items_map": {"key_a": [None, {"item_id": 3}]}}
+    assert get_model_serializer(Box, camelcased=True)(content) == {
+        "boxName": "big",
+        "mainItem": None,
+        "itemsList": [],
+        "itemsMap": {"keyA": [None, {"itemId": 3}]},
+    }
+
+
+def test_self_referencing_model_not_camelcased():
+    assert get_camelcased_model(Tree) is None
+
+    serializer = get_model_serializer(Tree, camelcased=True)
+    assert serializer({"node_name": "root", "child_nodes": [{"node_name": "leaf"}]}) == {
+        "nodeName": "root",
+        "childNodes": [{"nodeName": "leaf", "childNodes": []}],
+    }
+
+
+def test_model_serializer_ok():
+    content = {"main_item": Item(item_id=1), "extra": 1}
+
+    assert get_model_serializer(Box)(content) == {
+        "box_name": "box",
+        "main_item": {"item_id": 1},
+        "items_list": [],
+        "items_map": {},
+    }
+    assert get_model_serializer(Box, camelcased=True)(content) == {
+        "boxName": "box",
+        "mainItem": {"itemId": 1},
+        "itemsList": [],
+        "itemsMap": {},
+    }
+
+
+def test_trusted_model_serializer_ok():
+    content = {"main_item": Item(item_id=1), "items_list": [{"item_id": "2", "extra": 1}] * 3, "extra": 1}
+    serializer = get_model_serializer(Box, validation="trusted")
+
+    # fields are taken as is without validation, extra fields are dropped
+    assert serializer(content) == {
+        "box_name": "box",
+        "main_item": {"item_id": 1},
+        "items_list": [{"item_id": "2"}] * 3,
+        "items_map": {},
+    }
+    assert get_model_serializer(Box, camelcased=True, validation="trusted")({"main_item": None}) == {
+        "boxName": "box",
+        "mainItem": None,
+        "itemsList": [],
+        "itemsMap": {},
+    }
+
+
+def test_trusted_model_serializer_aliases_and_nested_models():
+    class Other(BaseModel):
+        other_id: int
+
+    class Aliased(BaseModel):
+        item_id: int = Field(alias="itemId")
+        mixed: List[Union[Item, Other]] = []
+        grid: List[List[Item]] = []
+        items: List[Optional[Item]] = []
+
+    content = {"itemId": 1, "mixed": [Item(item_id=2), Other(other_id=3)], "grid": [[Item(item_id=4)]], "items": [None]}
+    expected = {
+        "item_id": 1,
+        "mixed": [{"item_id": 2}, {"other_id": 3}],
+        "grid": [[{"item_id": 4}]],
+        "items": [None],
+    }
+
+    assert get_model_serializer(Aliased)(content) == expected
+    assert get_model_serializer(Aliased, validation="trusted")(content) == expected
+    assert get_model_serializer(List[List[Item]], validation="trusted")([[Item(item_id=1)]]) == [[{"item_id": 1}]]
+
+
+def test_sampled_model_serializer_ok(caplog):
+    serializer = get_model_serializer(Item, validation="sampled", sample_rate=2)
+
+    # every second response is validated, valid data isn't logged
+    assert serializer({"item_id": 1}) == {"item_id": 1}
+    assert serializer({"item_id": "x"}) == {"item_id": "x"}
+    assert not caplog.records
+
+    # validated response is only compared, trusted one is returned
+    assert serializer({"item_id": "1"}) == {"item_id": "1"}
+    assert "differs from validated by model Item" in caplog.text
+
+    assert serializer({"item_id": "2"}) == {"item_id": "2"}
+    assert serializer({"item_id": "x"}) == {"item_id": "x"}
+    assert "doesn't match model Item" in caplog.text
+
+
+def test_trusted_model_serializer_objects(caplog):
+    class Obj:
+        def __init__(self, **kwargs):
+            self.__dict__.update(kwargs)
+
+    content = Obj(box_name="obj", main_item=Obj(item_id=1), items_list=[Obj(item_id=2)], extra=1)
+    expected = {"box_name": "obj", "main_item": {"item_id": 1}, "items_list": [{"item_id": 2}], "items_map": {}}
+
+    assert get_model_serializer(Box, validation="trusted")(content) == expected
+    assert get_model_serializer(Box, validation="sampled", sample_rate=1)(content) == expected
+    assert "doesn't match model Box" in caplog.text
+
+
+@pytest.mark.parametrize("validation", ["full", "trusted", "sampled"])
+def test_container_model_serializer_ok(validation):
+    items = [{"item_id": 1, "extra": 1}, Item(item_id=2)]
+
+    assert get_model_serializer(List[Item], validation=validation, sample_rate=1)(items) == [
+        {"item_id": 1},
+        {"item_id": 2},
+    ]
+    assert get_model_serializer(Dict[str, Item], camelcased=True, validation=validation)({"key_a": items[0]}) == {
+        "keyA": {"itemId": 1}
+    }
+    assert get_root_model(List[Item]) is get_root_model(List[Item])
+
+
+def test_container_model_validated():
+    with pytest.raises(ValidationError) as e:
+        get_model_serializer(List[Item])([{"item_id": 1}, {"item_id": "x"}])
+
+    assert e.value.errors()[0]["loc"] == ("__root__", 1, "item_id")
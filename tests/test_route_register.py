@@ -1,9 +1,11 @@
+import asyncio
 import json
 
 import pytest
 from django.http import HttpResponse
 
 from djhug import route
+from djhug.requests_handler import RequestsHandler, DjhugMiddleware
 from djhug.routes import Routes
 from tests.utils import json_response
 
@@ -46,3 +48,65 @@ def test_only_one_django_route_per_view(routes: Routes):
         @routes.get("/1/")
         def view(*_):
             pass
+
+
+def test_one_handler_per_view(routes: Routes):
+    @routes.get("test/")
+    def view(request, year: int = 1):
+        return {}
+
+    [first] = routes.get_urlpatterns()
+    [second] = routes.get_urlpatterns()
+
+    assert isinstance(first.callback, RequestsHandler)
+    assert first.callback is second.callback
+    assert first.callback.compiled
+    assert RequestsHandler.create(view) is first.callback
+    assert RequestsHandler.create(first.callback) is first.callback
+
+
+def test_middleware_dispatches_registered_handler(rf, routes: Routes):
+    @routes.get("test/")
+    def view(request, year: int):
+        return {"year": year}
+
+    [pattern] = routes.get_urlpatterns()
+    middleware = DjhugMiddleware(lambda request: None)
+
+    for view_func in (view, pattern.callback):
+        resp: HttpResponse = middleware.process_view(rf.get("/test/", {"year": "2000"}), view_func, (), {})
+        assert resp.status_code == 200, resp.content
+        assert json.loads(resp.content) == {"year": 2000}
+
+
+def test_middleware_dispatches_async_handler(rf, routes: Routes):
+    @routes.get("test/")
+    async def view(request, year: int):
+        return {"year": year}
+
+    resp: HttpResponse = DjhugMiddleware(lambda request: None).process_view(
+        rf.get("/test/", {"year": "2000"}), view, (), {}
+    )
+    assert resp.status_code == 200, resp.content
+    assert json.loads(resp.content) == {"year": 2000}
+
+
+def test_async_middleware_awaits_handlers(rf, routes: Routes):
+    @routes.get("async/")
+    async def async_view(request, year: int):
+        return {"year": year}
+
+    @routes.get("sync/")
+    def sync_view(request, year: int):
+        return {"year": year}
+
+    async def get_response(request):
+        return None
+
+    middleware = DjhugMiddleware(get_response)
+    assert asyncio.iscoroutinefunction(middleware.process_view)
+
+    for view in (async_view, sync_view):
+        resp: HttpResponse = asyncio.run(middleware.process_view(rf.get("/", {"year": "2000"}), view, (), {}))
+        assert resp.status_code == 200, resp.content
+        assert json.loads(resp.content) == {"year": 2000}
@@ -2,6 +2,7 @@ from django.test import override_settings
 
 from djhug import request_parser, response_renderer
 from djhug.content_negotiation import get_request_parsers, get_response_renderers
+from djhug.options import Options
 from djhug.settings import Settings
 
 
@@ -47,3 +48,46 @@ def test_camelcased_response_data_ok():
 
     with override_settings(DJHUG_CAMELCASED_RESPONSE_DATA=True):
         assert Settings().camelcased_response_data
+
+
+def test_request_max_body_size_ok():
+    assert Settings().request_max_body_size is None
+    assert Options().request_max_body_size is None
+
+    with override_settings(DJHUG_REQUEST_MAX_BODY_SIZE=1024):
+        assert Settings().request_max_body_size == 1024
+        assert Options().request_max_body_size == 1024
+
+
+def test_settings_loaded_once(monkeypatch):
+    Settings.reset()
+    loads = []
+    load = Settings._load
+    monkeypatch.setattr(Settings, "_load", lambda self: loads.append(1) or load(self))
+
+    Settings()
+    Options()
+    assert Settings().json_backend == "json"
+    assert len(loads) == 1
+
+    with override_settings(DJHUG_JSON_BACKEND="orjson"):
+        assert Settings().json_backend == "orjson"
+        Options()
+        assert len(loads) == 2
+
+    assert Settings().json_backend == "json"
+    assert len(loads) == 3
+
+
+def test_settings_published_at_once(monkeypatch):
+    seen = []
+
+    def import_module(path):
+        seen.append(dict(Settings._Settings__shared_state))
+
+    monkeypatch.setattr("djhug.settings.import_module", import_module)
+
+    with override_settings(DJHUG_REQUEST_PARSERS_MODULES=["tests.test_settings"]):
+        assert Settings().request_parsers_modules == ["tests.test_settings"]
+
+    assert seen == [{}]
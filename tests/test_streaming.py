@@ -0,0 +1,120 @@
+import csv
+import io
+import json
+from typing import Dict, List
+
+import pytest
+from django.http import StreamingHttpResponse
+from pydantic import BaseModel, ValidationError
+
+import djhug
+from djhug.exceptions import ConfigError
+
+
+def test_stream_json_ok(client, with_urlpatterns, routes: djhug.Routes):
+    @routes.get("test/")
+    def view(request, count: int):
+        return ({"item_id": i} for i in range(count))
+
+    with_urlpatterns(routes.get_urlpatterns())
+
+    for count in (0, 1, 250):
+        resp: StreamingHttpResponse = client.get("/test/", {"count": count})
+
+        assert resp.status_code == 200
+        assert resp.streaming
+        assert resp["Content-Type"] == "application/json"
+        assert json.loads(b"".join(resp.streaming_content)) == [{"item_id": i} for i in range(count)]
+
+
+def test_stream_response_model_ok(client, with_urlpatterns, routes: djhug.Routes):
+    class Item(BaseModel):
+        item_id: int
+
+    @djhug.response.camelcased
+    @routes.get("test/", response_model=Item)
+    def view(request):
+        return iter([{"item_id": "1", "extra": 1}, {"item_id": 2}])
+
+    @djhug.response.camelcased
+    @routes.get("list/", response_model=List[Item])
+    def list_view(request):
+        return iter([{"item_id": "1", "extra": 1}, {"item_id": 2}])
+
+    with_urlpatterns(routes.get_urlpatterns())
+
+    for path in ("/test/", "/list/"):
+        resp: StreamingHttpResponse = client.get(path, HTTP_ACCEPT="application/x-ndjson")
+
+        assert resp.status_code == 200
+        assert resp["Content-Type"] == "application/x-ndjson"
+        assert [json.loads(line) for line in b"".join(resp.streaming_content).splitlines()] == [
+            {"itemId": 1},
+            {"itemId": 2},
+        ]
+
+
+def test_stream_csv_ok(client, with_urlpatterns, routes: djhug.Routes):
+    @routes.get("test/")
+    def view(request):
+        return ({"id": i, "name": "name %d" % i} for i in range(150))
+
+    with_urlpatterns(routes.get_urlpatterns())
+
+    resp: StreamingHttpResponse = client.get("/test/", HTTP_ACCEPT="text/csv")
+
+    assert resp.status_code == 200
+    assert resp["Content-Type"] == "text/csv"
+    rows = list(csv.DictReader(io.StringIO(b"".join(resp.streaming_content).decode())))
+    assert rows == [{"id": str(i), "name": "name %d" % i} for i in range(150)]
+
+
+def test_stream_first_item_validated(client, with_urlpatterns, routes: djhug.Routes):
+    class Item(BaseModel):
+        item_id: int
+
+    class CustomResponse(StreamingHttpResponse):
+        pass
+
+    @routes.get("invalid/", response_model=Item)
+    def invalid(request):
+        return iter([{"item_id": "x"}, {"item_id": 1}])
+
+    @routes.get("custom/", response_model=Item, response_cls=CustomResponse)
+    def custom(request):
+        return iter([{"item_id": 1}])
+
+    with_urlpatterns(routes.get_urlpatterns())
+
+    resp = client.get("/custom/")
+    assert isinstance(resp, CustomResponse)
+    assert json.loads(b"".join(resp.streaming_content)) == [{"item_id": 1}]
+
+    with pytest.raises(ValidationError):
+        client.get("/invalid/")
+
+
+def test_stream_mapping_response_model_rejected(client, with_urlpatterns, routes: djhug.Routes):
+    class Item(BaseModel):
+        item_id: int
+
+    @routes.get("test/", response_model=Dict[str, Item])
+    def view(request):
+        return iter([{"item_id": 1}])
+
+    with_urlpatterns(routes.get_urlpatterns())
+
+    with pytest.raises(ConfigError):
+        client.get("/test/")
+
+
+def test_generator_mapping_response_model_rejected_on_compile(routes: djhug.Routes):
+    class Item(BaseModel):
+        item_id: int
+
+    @routes.get("test/", response_model=Dict[str, Item])
+    def view(request):
+        yield {"item_id": 1}
+
+    with pytest.raises(ConfigError, match="Streamed items can't be validated"):
+        routes.get_urlpatterns()
@@ -0,0 +1,58 @@
+import sys
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from djhug.utils import camelcase, underscore, camelcase_text, get_model_key_map
+
+
+def test_camelcase_underscore_ok():
+    data = {"some_key": [{"nested_key": 1, "other": {"deep_key": [1, {"the_end": None}]}}], 1: "value_a"}
+    expected = {"someKey": [{"nestedKey": 1, "other": {"deepKey": [1, {"theEnd": None}]}}], 1: "value_a"}
+
+    assert camelcase(data) == expected
+    assert underscore(expected) == data
+    assert camelcase("some_text") == "some_text"
+    assert camelcase([[], {}]) == [[], {}]
+
+
+def test_transform_deep_nesting_ok():
+    depth = sys.getrecursionlimit() * 2
+    data = {}
+    node = data
+    for _ in range(depth):
+        node["next_node"] = [{}]
+        node = node["next_node"][0]
+
+    result = camelcase(data)
+    for _ in range(depth):
+        result = result["nextNode"][0]
+    assert result == {}
+
+
+def test_model_key_map():
+    class Item(BaseModel):
+        item_id: int
+
+    class Box(BaseModel):
+        box_name: str
+        items: List[Item]
+        main_item: Optional[Item]
+        child_box: Optional["Box"]
+
+    Box.update_forward_refs()
+
+    key_map = get_model_key_map(Box, camelcase_text)
+
+    assert key_map == {
+        "box_name": "boxName",
+        "items": "items",
+        "main_item": "mainItem",
+        "child_box": "childBox",
+        "item_id": "itemId",
+    }
+    assert get_model_key_map(Box, camelcase_text) is key_map
+    assert camelcase({"box_name": "x", "items": [{"item_id": 1}]}, key_map=key_map) == {
+        "boxName": "x",
+        "items": [{"itemId": 1}],
+    }
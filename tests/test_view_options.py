@@ -1,7 +1,7 @@
 from datetime import datetime
 
 from djhug import route
-from djhug.arguments import Spec, Arg, Body
+from djhug.arguments import Spec, Arg, Body, ArgumentsResolver
 from djhug.constants import EMPTY
 from djhug.routes import Options
 
@@ -54,3 +54,50 @@ def test_options_contribute_decorator_call():
         return locals()
 
     assert isinstance(view.__djhug_options__, Options)
+
+
+def test_view_arguments_loader_compiled():
+    @route
+    def view(request, generic: int, no_annotation, json: float = 1.0, with_default: str = "foo"):
+        return locals()
+
+    loader = view.__djhug_options__.spec.loader
+    assert loader.model is not None
+    assert set(loader.fields.values()) == {"generic", "json", "with_default"}
+
+    values, errors = loader.load({"generic": "1", "no_annotation": "raw", "json": "2.5"})
+    assert values == {"generic": 1, "no_annotation": "raw", "json": 2.5}
+    assert errors == {}
+
+    values, errors = loader.load({"generic": "one"})
+    assert values == {}
+    assert errors == {
+        "generic": [{"loc": ("__root__",), "msg": "value is not a valid integer", "type": "type_error.integer"}]
+    }
+
+
+def test_view_arguments_resolver():
+    @route
+    def view(request, user_id: int, page_size: int = 10, order_by: str = "id"):
+        return locals()
+
+    args = view.__djhug_options__.spec.args[1:]
+
+    resolver = ArgumentsResolver(args)
+    assert [lookup.keys for lookup in resolver.lookups] == [("user_id",), ("page_size",), ("order_by",)]
+    assert resolver.resolve({"user_id": 1}, {"user_id": "2", "page_size": "5"}, {"order_by": "name"}) == (
+        {"user_id": 1, "page_size": "5", "order_by": "name"},
+        [],
+    )
+    assert resolver.resolve({}, {"page_size": "5"}, None) == ({"page_size": "5"}, ["user_id"])
+
+    resolver = ArgumentsResolver(args, camelcased_data=True)
+    assert [lookup.keys for lookup in resolver.lookups] == [
+        ("userId", "user_id"),
+        ("pageSize", "page_size"),
+        ("orderBy", "order_by"),
+    ]
+    assert resolver.resolve({"user_id": 1}, {"pageSize": "5", "page_size": "6"}, {}) == (
+        {"user_id": 1, "page_size": "5"},
+        [],
+    )
@@ -0,0 +1,67 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command, CommandError
+from django.test import override_settings
+from django.urls import include, path
+
+import djhug
+from djhug.exceptions import ConfigError
+from djhug.requests_handler import RequestsHandler
+from djhug.routes import LazyView
+
+
+def test_routes_warmup(routes: djhug.Routes):
+    @routes.get("<int:year>/")
+    def view(request, year: int, month: int = 1):
+        return {"year": year}
+
+    @routes.get("broken/")
+    def broken(request, value: len):
+        return {}
+
+    [result, broken_result] = routes.warmup()
+    assert result.path == "<int:year>/"
+    assert result.view_path == "tests.test_warmup.view"
+    assert result.error is None
+    assert result.duration > 0
+    assert RequestsHandler.create(view).compiled
+    assert broken_result.error is not None
+
+    with pytest.raises(ConfigError, match="tests.test_warmup.broken"):
+        routes.warmup(fail_fast=True)
+
+
+def test_warmup_command(with_urlpatterns):
+    routes = djhug.Routes(lazy=True)
+
+    @routes.get("<int:year>/")
+    def view(request, year: int, month: int = 1):
+        return {"year": year}
+
+    urlpatterns = routes.get_urlpatterns()
+    with_urlpatterns([path("api/", include(urlpatterns))])
+
+    lazy_view: LazyView = urlpatterns[0].callback
+    assert not lazy_view.loaded
+
+    out = StringIO()
+    call_command("djhug_warmup", stdout=out)
+    assert lazy_view.loaded
+    assert "api/<int:year>/  tests.test_warmup.view" in out.getvalue()
+    assert "1 routes compiled" in out.getvalue()
+
+
+def test_warmup_command_errors(with_urlpatterns, routes: djhug.Routes):
+    @routes.get("broken/")
+    def broken(request, value: len):
+        return {}
+
+    routes.lazy = True
+    with_urlpatterns(routes.get_urlpatterns())
+
+    with pytest.raises(CommandError, match="1 routes can't be compiled"):
+        call_command("djhug_warmup", stdout=StringIO())
+
+    with pytest.raises(CommandError, match="Can't compile view tests.test_warmup.broken"):
+        call_command("djhug_warmup", "--fail-fast", stdout=StringIO())